@@ -144,7 +144,9 @@ async def analyze_paper(file: UploadFile = File(...)):
             temp_file.unlink()
 
 
-@app.get("/api/health")
+# HEAD is listed explicitly: FastAPI does not add it to GET routes, and
+# status-only probes (tests/test_web_api.py) have no use for the body
+@app.api_route("/api/health", methods=["GET", "HEAD"])
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "version": "0.1.0"}
@@ -13,8 +13,6 @@ def download_nltk_data():
     console.print("\n[bold cyan]Downloading NLTK Data...[/bold cyan]\n")
     
     datasets = [
-        ('punkt', 'Punkt Tokenizer'),
-        ('punkt_tab', 'Punkt Tokenizer Tables'),
         ('stopwords', 'Stopwords'),
         ('averaged_perceptron_tagger', 'POS Tagger'),
     ]
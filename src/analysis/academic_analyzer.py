@@ -151,7 +151,9 @@ class AcademicAnalyzer:
         if use_nlp and not use_llm:  # Only use NLP if LLM is not available
             try:
                 from .nlp_processor import NLPProcessor
-                self.nlp_processor = NLPProcessor()
+                # Load the components now so a missing spaCy model or NLTK
+                # data is caught here rather than in the middle of analyze()
+                self.nlp_processor = NLPProcessor().load()
                 print("✓ NLP processor initialized")
             except Exception as e:
                 print(f"Warning: Could not initialize NLP processor: {e}")
@@ -160,6 +162,9 @@ class AcademicAnalyzer:
                 self.nlp_processor = None
         else:
             self.nlp_processor = None if use_llm else None
+        
+        # NLP results for the paper currently being analyzed, keyed by (text, section_type)
+        self._nlp_results: dict = {}
     
     def analyze(self, paper) -> 'AcademicAnalysis':
         """
@@ -239,6 +244,18 @@ class AcademicAnalyzer:
         introduction_content = self._extract_section_content(paper, "introduction")
         conclusion_content = self._extract_section_content(paper, "conclusion")
         
+        # Run NLP over every text the extractors need in one batch
+        self._nlp_results = {}
+        if self.use_nlp and self.nlp_processor:
+            self._prefetch_nlp([
+                (self._problem_text(abstract, introduction_content), "introduction"),
+                (abstract, None),
+                (methodology_content, "methodology"),
+                (f"{abstract} {conclusion_content}", None),
+                (conclusion_content, None),
+                (self._key_concepts_text(paper), None),
+            ])
+        
         # Build analysis (template version)
         analysis = AcademicAnalysis(
             paper_title=paper.title,
@@ -285,6 +302,28 @@ class AcademicAnalyzer:
         
         return analysis
     
+    def _prefetch_nlp(self, requests: list[tuple[str, Optional[str]]]) -> None:
+        """Process (text, section_type) pairs with a single NLP batch call."""
+        pending = [
+            key for key in dict.fromkeys(requests)
+            if key[0] and key not in self._nlp_results
+        ]
+        if not pending:
+            return
+        
+        results = self.nlp_processor.process_batch(
+            [text for text, _ in pending],
+            [section_type for _, section_type in pending]
+        )
+        self._nlp_results.update(zip(pending, results))
+    
+    def _process_text(self, text: str, section_type: Optional[str] = None) -> dict:
+        """Return NLP results for a text, reusing results from the current analysis."""
+        key = (text, section_type)
+        if key not in self._nlp_results:
+            self._nlp_results[key] = self.nlp_processor.process(text, section_type=section_type)
+        return self._nlp_results[key]
+    
     def _extract_section_content(self, paper: Paper, section_type: str) -> str:
         """Extract content from a specific section type."""
         for section in paper.sections:
@@ -313,8 +352,8 @@ The proposed approach is described in the abstract and introduction sections. Fu
             return "Problem statement not explicitly identified in abstract."
         
         # Process with NLP
-        text = f"{abstract} {intro[:500]}"  # Limit intro
-        nlp_result = self.nlp_processor.process(text, section_type="introduction")
+        text = self._problem_text(abstract, intro)
+        nlp_result = self._process_text(text, section_type="introduction")
         
         # Look for sentences with OBJECTIVE or BACKGROUND function
         from .nlp_processor import RhetoricalFunction
@@ -326,13 +365,17 @@ The proposed approach is described in the abstract and introduction sections. Fu
         sentences = abstract.split('. ')
         return sentences[0] + "." if sentences else "Problem statement not found."
     
+    def _problem_text(self, abstract: str, intro: str) -> str:
+        """Text analyzed for the problem statement."""
+        return f"{abstract} {intro[:500]}"  # Limit intro
+    
     def _extract_domain_relevance(self, abstract: str) -> str:
         """Extract domain relevance using NLP."""
         if not self.use_nlp or not self.nlp_processor:
             return "Domain relevance requires deeper semantic analysis (Phase 2)."
         
         # Process abstract
-        nlp_result = self.nlp_processor.process(abstract)
+        nlp_result = self._process_text(abstract)
         
         # Look for BACKGROUND sentences that explain relevance
         from .nlp_processor import RhetoricalFunction
@@ -352,7 +395,7 @@ The proposed approach is described in the abstract and introduction sections. Fu
             return ["Constraints require LLM-based extraction (Phase 2)"]
         
         # Process methodology
-        nlp_result = self.nlp_processor.process(methodology, section_type="methodology")
+        nlp_result = self._process_text(methodology, section_type="methodology")
         
         # Look for constraint-indicating sentences
         constraints = []
@@ -376,7 +419,7 @@ The proposed approach is described in the abstract and introduction sections. Fu
             return "Input data description requires semantic analysis (Phase 2)."
         
         # Process methodology
-        nlp_result = self.nlp_processor.process(methodology, section_type="methodology")
+        nlp_result = self._process_text(methodology, section_type="methodology")
         
         # Look for MATERIAL entities (datasets)
         from .nlp_processor import ScientificEntityType
@@ -402,7 +445,7 @@ The proposed approach is described in the abstract and introduction sections. Fu
             return ["Technique extraction requires LLM analysis (Phase 2)"]
         
         # Process methodology
-        nlp_result = self.nlp_processor.process(methodology, section_type="methodology")
+        nlp_result = self._process_text(methodology, section_type="methodology")
         
         # Extract METHOD entities
         from .nlp_processor import ScientificEntityType
@@ -424,7 +467,7 @@ The proposed approach is described in the abstract and introduction sections. Fu
             return "Pipeline description requires semantic analysis (Phase 2)."
         
         # Process methodology
-        nlp_result = self.nlp_processor.process(methodology, section_type="methodology")
+        nlp_result = self._process_text(methodology, section_type="methodology")
         
         # Look for METHOD function sentences
         from .nlp_processor import RhetoricalFunction
@@ -448,7 +491,7 @@ The proposed approach is described in the abstract and introduction sections. Fu
             return "Evaluation method requires semantic analysis (Phase 2)."
         
         # Process methodology
-        nlp_result = self.nlp_processor.process(methodology, section_type="methodology")
+        nlp_result = self._process_text(methodology, section_type="methodology")
         
         # Look for METRIC entities
         from .nlp_processor import ScientificEntityType
@@ -477,7 +520,7 @@ The proposed approach is described in the abstract and introduction sections. Fu
         text = f"{abstract} {conclusion}"
         
         # Process with NLP
-        nlp_result = self.nlp_processor.process(text)
+        nlp_result = self._process_text(text)
         
         # Extract sentences with RESULT or CONCLUSION function
         contributions = []
@@ -510,7 +553,7 @@ The proposed approach is described in the abstract and introduction sections. Fu
             return ["Limitation extraction requires semantic analysis (Phase 2)"]
         
         # Process with NLP
-        nlp_result = self.nlp_processor.process(conclusion)
+        nlp_result = self._process_text(conclusion)
         
         # Extract sentences with LIMITATION function
         limitations = []
@@ -538,13 +581,8 @@ The proposed approach is described in the abstract and introduction sections. Fu
                 "Concept Extraction": "Requires NER and semantic analysis (Phase 2)"
             }
         
-        # Combine all text
-        text = f"{paper.title} {paper.abstract or ''}"
-        for section in paper.sections[:3]:  # First 3 sections
-            text += f" {section.content[:500]}"  # Limit per section
-        
         # Process with NLP
-        nlp_result = self.nlp_processor.process(text)
+        nlp_result = self._process_text(self._key_concepts_text(paper))
         
         # Extract concepts from entities
         concepts = {}
@@ -576,6 +614,13 @@ The proposed approach is described in the abstract and introduction sections. Fu
         # Limit to top 10 concepts
         return dict(list(concepts.items())[:10])
     
+    def _key_concepts_text(self, paper: Paper) -> str:
+        """Text analyzed for key concepts: title, abstract and opening sections."""
+        text = f"{paper.title} {paper.abstract or ''}"
+        for section in paper.sections[:3]:  # First 3 sections
+            text += f" {section.content[:500]}"  # Limit per section
+        return text
+    
     def _classify_thematically(self, title: str, abstract: str) -> list[str]:
         """Classify paper thematically."""
         # Simple keyword-based classification
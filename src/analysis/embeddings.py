@@ -7,7 +7,7 @@ domain-specific models like SciBERT and SPECTER2.
 Based on design_specification.md Section 2.A: Modelos de Representación (Embeddings)
 """
 
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 import numpy as np
 from dataclasses import dataclass
 
@@ -18,6 +18,53 @@ except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
     print("Warning: sentence-transformers not available. Install with: pip install sentence-transformers")
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Without Numba, INT8 rows are converted to float32 this many at a time, so
+# the temporary float copy stays small instead of matching the whole index
+FALLBACK_BLOCK_ROWS = 1024
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _batched_dot_i8(matrix, query, scales, out):
+        """Dot every INT8 row with an INT8 query, accumulating in integers."""
+        n, d = matrix.shape
+        for i in prange(n):
+            s = 0
+            for j in range(d):
+                s += np.int32(matrix[i, j]) * np.int32(query[j])
+            out[i] = s * scales[i]
+
+
+def _normalize(vector: np.ndarray) -> np.ndarray:
+    """Return a float32 unit-length copy of a vector (zero vectors stay zero)."""
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    if norm == 0:
+        return vector.copy()
+    return vector / norm
+
+
+def _quantize(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Symmetric INT8 quantization of a vector after normalizing it.
+    
+    Returns the quantized vector and the scale that maps it back to the
+    unit vector (``unit ≈ quantized * scale``).
+    """
+    unit = _normalize(vector)
+    peak = float(np.max(np.abs(unit)))
+    if peak == 0:
+        return np.zeros(unit.shape, dtype=np.int8), 0.0
+    quantized = np.round(unit * (127.0 / peak)).astype(np.int8)
+    return quantized, peak / 127.0
+
 
 @dataclass
 class EmbeddingResult:
@@ -94,13 +141,9 @@ class ScientificEmbedder:
         texts = [text] if is_single else text
         
         # Generate embeddings
-        embeddings = self.model.encode(
-            texts,
-            convert_to_numpy=True,
-            show_progress_bar=len(texts) > 10
-        )
+        embeddings = self.embed_texts_matrix(texts)
         
-        # Wrap in result objects
+        # Wrap in result objects (rows are contiguous views of the matrix)
         results = [
             EmbeddingResult(
                 embedding=emb,
@@ -112,6 +155,28 @@ class ScientificEmbedder:
         
         return results[0] if is_single else results
     
+    def embed_texts_matrix(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings for a batch of texts as a single matrix.
+        
+        Use this instead of embed_text when the per-text EmbeddingResult
+        wrappers are not needed.
+        
+        Args:
+            texts: List of texts
+            
+        Returns:
+            C-contiguous float32 array of shape (len(texts), dimension) with
+            unit-length rows
+        """
+        embeddings = self.model.encode(
+            texts,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=len(texts) > 10
+        )
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+    
     def embed_paper(
         self,
         title: str,
@@ -122,7 +187,8 @@ class ScientificEmbedder:
         Generate embedding for a complete paper.
         
         For scientific papers, we combine title and abstract as they contain
-        the most concentrated semantic information.
+        the most concentrated semantic information. Each part is encoded once
+        and the unit embeddings are combined as a weighted mean.
         
         Args:
             title: Paper title
@@ -132,17 +198,29 @@ class ScientificEmbedder:
         Returns:
             EmbeddingResult for the paper
         """
-        # Combine title and abstract (weighted)
-        # Title is more important for topic identification
-        paper_text = f"{title}. {title}. {abstract}"
+        # Embed title, abstract and (optionally) key sections separately, then
+        # weight them in embedding space. Title is more important for topic
+        # identification, so it gets twice the weight of the abstract.
+        texts = [title, abstract]
+        weights = [2.0, 1.0]
         
-        # Optionally include key sections
         if sections:
             # Limit to avoid token limits
-            sections_text = " ".join(sections[:3])[:1000]
-            paper_text += f" {sections_text}"
+            texts.extend(section[:1000] for section in sections[:3])
+            weights.extend([0.3] * len(sections[:3]))
+        
+        embeddings = self.embed_texts_matrix(texts)
+        
+        w = np.array(weights, dtype=np.float32)
+        w /= w.sum()
+        combined = embeddings.T @ w
+        combined /= np.linalg.norm(combined) + 1e-12
         
-        return self.embed_text(paper_text)
+        return EmbeddingResult(
+            embedding=combined,
+            model_name=self.model_name,
+            dimension=self.dimension
+        )
     
     def compute_similarity(
         self,
@@ -184,6 +262,8 @@ class SemanticSearchEngine:
     Semantic search engine for scientific papers.
     
     Uses embeddings to find semantically similar papers or passages.
+    Paper embeddings are stored normalized and quantized to INT8 with one
+    float32 scale per paper, a quarter of the float32 footprint.
     """
     
     def __init__(self, embedder: ScientificEmbedder):
@@ -194,8 +274,15 @@ class SemanticSearchEngine:
             embedder: ScientificEmbedder instance to use
         """
         self.embedder = embedder
-        self.paper_embeddings = []
+        self.paper_embeddings = []  # INT8 quantized unit embeddings
+        self.paper_scales = []  # Per-embedding dequantization scales
         self.paper_metadata = []
+        
+        # (N, D) INT8 matrix and (N,) scales, rebuilt lazily after indexing
+        self._matrix: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        # Score buffer reused between queries
+        self._scores: Optional[np.ndarray] = None
     
     def index_paper(
         self,
@@ -215,7 +302,10 @@ class SemanticSearchEngine:
         """
         embedding = self.embedder.embed_paper(title, abstract, sections)
         
-        self.paper_embeddings.append(embedding.embedding)
+        quantized, scale = _quantize(embedding.embedding)
+        self.paper_embeddings.append(quantized)
+        self.paper_scales.append(scale)
+        self._matrix = None
         self.paper_metadata.append({
             'id': paper_id,
             'title': title,
@@ -243,13 +333,14 @@ class SemanticSearchEngine:
         # Embed query
         query_embedding = self.embedder.embed_text(query).embedding
         
-        # Compute similarities
-        similarities = []
-        for i, paper_emb in enumerate(self.paper_embeddings):
-            sim = self.embedder.compute_similarity(query_embedding, paper_emb)
-            similarities.append((i, sim))
+        # Compute cosine similarities against all papers at once
+        scores = self._cosine_scores(query_embedding)
         
-        # Sort by similarity
+        # Sort by similarity, mapped to [0, 1] as in compute_similarity
+        similarities = [
+            (i, float(np.clip((score + 1) / 2, 0, 1)))
+            for i, score in enumerate(scores)
+        ]
         similarities.sort(key=lambda x: x[1], reverse=True)
         
         # Return top-k results
@@ -260,6 +351,37 @@ class SemanticSearchEngine:
             results.append(result)
         
         return results
+    
+    def _cosine_scores(self, query: np.ndarray) -> np.ndarray:
+        """
+        Compute approximate cosine similarities between a query and every indexed paper.
+        
+        The query is quantized like the stored embeddings. Uses a parallel Numba
+        kernel with integer accumulation when available, otherwise NumPy
+        matrix-vector products over blocks of rows. The returned array is a
+        reused buffer, valid until the next query.
+        """
+        if self._matrix is None:
+            self._matrix = np.ascontiguousarray(np.vstack(self.paper_embeddings))
+            self._scales = np.array(self.paper_scales, dtype=np.float32)
+        
+        n = self._matrix.shape[0]
+        if self._scores is None or self._scores.shape[0] != n:
+            self._scores = np.empty(n, dtype=np.float32)
+        
+        query_i8, query_scale = _quantize(query)
+        
+        if NUMBA_AVAILABLE:
+            _batched_dot_i8(self._matrix, query_i8, self._scales, self._scores)
+        else:
+            query_f32 = query_i8.astype(np.float32)
+            for start in range(0, n, FALLBACK_BLOCK_ROWS):
+                stop = min(start + FALLBACK_BLOCK_ROWS, n)
+                np.dot(self._matrix[start:stop], query_f32, out=self._scores[start:stop])
+            self._scores *= self._scales
+        
+        self._scores *= query_scale
+        return self._scores
 
 
 # Convenience function for quick embedding generation
@@ -6,9 +6,52 @@ Much faster than other providers while maintaining high quality.
 """
 
 import os
+import threading
 from typing import Optional, Dict, Any
 import json
-from groq import Groq
+
+import httpx
+from groq import DefaultHttpxClient, Groq
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+# Shared Groq clients, keyed by API key. Reusing one client keeps the
+# underlying connection pool (and its TCP/TLS sessions) warm across analyses.
+_groq_clients: Dict[str, Groq] = {}
+_groq_analyzers: Dict[str, "GroqAnalyzer"] = {}
+_groq_lock = threading.Lock()
+
+
+def _create_http_client() -> httpx.Client:
+    """
+    Create a pooled HTTP client, using HTTP/2 when the h2 package is installed.
+    
+    Built on the Groq SDK's default client so its timeout and redirect
+    settings are kept.
+    """
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+    try:
+        return DefaultHttpxClient(http2=True, limits=limits)
+    except ImportError:
+        # h2 not installed: fall back to HTTP/1.1 keep-alive pooling
+        return DefaultHttpxClient(limits=limits)
+
+
+def _get_groq_client(api_key: str) -> Groq:
+    """Return the shared Groq client for an API key, creating it on first use."""
+    client = _groq_clients.get(api_key)
+    if client is None:
+        with _groq_lock:
+            client = _groq_clients.get(api_key)
+            if client is None:
+                client = Groq(api_key=api_key, http_client=_create_http_client())
+                _groq_clients[api_key] = client
+    return client
 
 
 class GroqAnalyzer:
@@ -36,8 +79,8 @@ class GroqAnalyzer:
                 "or pass api_key parameter."
             )
         
-        # Initialize Groq client
-        self.client = Groq(api_key=self.api_key)
+        # Reuse the shared Groq client for this key
+        self.client = _get_groq_client(self.api_key)
         
         # Use Llama 3.3 70B - latest stable endpoint
         self.model = "llama-3.3-70b-versatile"
@@ -80,7 +123,7 @@ class GroqAnalyzer:
             
             # Parse response
             analysis_text = response.choices[0].message.content
-            analysis = json.loads(analysis_text)
+            analysis = _loads(analysis_text)
             
             return analysis
             
@@ -200,5 +243,10 @@ def analyze_with_groq(paper, api_key: Optional[str] = None) -> Dict[str, Any]:
     Returns:
         Analysis dictionary
     """
-    analyzer = GroqAnalyzer(api_key=api_key)
+    key = api_key or os.getenv("GROQ_API_KEY") or ""
+    analyzer = _groq_analyzers.get(key)
+    if analyzer is None:
+        analyzer = GroqAnalyzer(api_key=api_key)
+        with _groq_lock:
+            analyzer = _groq_analyzers.setdefault(key, analyzer)
     return analyzer.analyze_paper(paper)
@@ -10,29 +10,109 @@ This module provides advanced NLP capabilities for analyzing scientific papers:
 Based on design_specification.md Section 2.B: Pipeline de NLP y Extracción de Información
 """
 
+import bisect
+import atexit
+import functools
+import heapq
+import multiprocessing
+import operator
+import os
 import re
-from typing import List, Dict, Tuple, Optional
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Dict, Tuple, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
 import spacy
+from spacy.language import Language
+from spacy.matcher import Matcher, PhraseMatcher
 from spacy.tokens import Doc, Span
 import nltk
-from nltk.tokenize import sent_tokenize
 from nltk.corpus import stopwords
 
-# Download required NLTK data
 try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
+# Download required NLTK data
 try:
     nltk.data.find('corpora/stopwords')
 except LookupError:
     nltk.download('stopwords', quiet=True)
 
 
+# spaCy model shared by all components (package name or path). Only the
+# tokenizer, tagger and parser are needed (for noun chunks and sentence
+# boundaries).
+SPACY_MODEL = os.getenv("PAPER_SPACY_MODEL", "en_core_web_sm")
+SPACY_DISABLED = ["ner", "lemmatizer"]
+
+# Number of texts spaCy groups together in NLPProcessor.process_batch
+SPACY_BATCH_SIZE = int(os.getenv("PAPER_SPACY_BATCH_SIZE", "32"))
+
+# NLPProcessor.process_batch runs in worker processes only when the input
+# is large enough to pay for starting them
+PARALLEL_MIN_CHARS = 50_000
+PARALLEL_MIN_TEXTS = 4
+PARALLEL_MAX_WORKERS = 4
+
+# Worker pool for process_batch, created on first use and kept for the process
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+# Number of texts whose key phrases KeyPhraseExtractor remembers
+KEYPHRASE_CACHE_SIZE = 128
+
+# Set once _load_nlp has tried to download the spaCy model in this process
+_download_attempted = False
+
+
+@functools.lru_cache(maxsize=1)
+def _load_nlp() -> Language:
+    """
+    Load the spaCy pipeline, downloading the model if it is missing.
+    
+    Cached, so every component in the process shares one loaded model.
+    """
+    global _download_attempted
+    try:
+        return spacy.load(SPACY_MODEL, disable=SPACY_DISABLED)
+    except OSError:
+        # lru_cache does not cache exceptions, so only try the download once
+        if _download_attempted:
+            raise
+        _download_attempted = True
+        print(f"Downloading spaCy model '{SPACY_MODEL}'...")
+        import subprocess
+        subprocess.run(["python", "-m", "spacy", "download", SPACY_MODEL])
+        return spacy.load(SPACY_MODEL, disable=SPACY_DISABLED)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_stopwords() -> frozenset:
+    """Load the NLTK English stopwords once per process."""
+    return frozenset(stopwords.words('english'))
+
+
+def _noun_chunks(doc: Doc):
+    """Noun chunks of a Doc, or none if the pipeline has no parser."""
+    return doc.noun_chunks if doc.has_annotation("DEP") else ()
+
+
+def _build_automaton(keywords: Dict[str, list]):
+    """Build an Aho-Corasick automaton mapping each keyword to (keyword, values)."""
+    automaton = ahocorasick.Automaton()
+    for keyword, values in keywords.items():
+        automaton.add_word(keyword, (keyword, tuple(values)))
+    automaton.make_automaton()
+    return automaton
+
+
 class RhetoricalFunction(Enum):
     """Rhetorical function of a sentence in academic writing."""
     BACKGROUND = "background"
@@ -81,119 +161,180 @@ class ScientificNER:
     from scientific text using pattern matching and linguistic features.
     """
     
-    def __init__(self):
-        """Initialize the scientific NER system."""
-        # Load spaCy model for linguistic analysis
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            print("Downloading spaCy model 'en_core_web_sm'...")
-            import subprocess
-            subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-            self.nlp = spacy.load("en_core_web_sm")
-        
-        # Patterns for entity extraction
+    def __init__(self, nlp: Optional[Language] = None):
+        """
+        Initialize the scientific NER system.
+        
+        Args:
+            nlp: spaCy pipeline to use (loaded if not provided)
+        """
+        # spaCy model for linguistic analysis
+        self.nlp = nlp or _load_nlp()
+        
+        # Literal keywords and true regex patterns for entity extraction
+        self.terms = self._initialize_terms()
         self.patterns = self._initialize_patterns()
+        
+        # Literal keywords are matched case-insensitively on the tokens of
+        # the already processed Doc, one match key per entity type
+        self.phrase_matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
+        for entity_type, terms in self.terms.items():
+            self.phrase_matcher.add(entity_type.name, [self.nlp.make_doc(term) for term in terms])
+        
+        # Versioned names such as "ImageNet-1k" or "COCO-2017" stay one token,
+        # so single-token terms are also matched as the start of a token when
+        # a non-word character follows (as a \b-delimited regex would)
+        self.term_prefixes: Dict[ScientificEntityType, re.Pattern] = {}
+        self.prefix_matcher = Matcher(self.nlp.vocab)
+        for entity_type, terms in self.terms.items():
+            single_token = sorted(
+                (term.lower() for term in terms if len(self.nlp.make_doc(term)) == 1),
+                key=len,
+                reverse=True,
+            )
+            if not single_token:
+                continue
+            pattern = "^(?:" + "|".join(map(re.escape, single_token)) + r")(?=\W)"
+            self.term_prefixes[entity_type] = re.compile(pattern)
+            self.prefix_matcher.add(entity_type.name, [[{"LOWER": {"REGEX": pattern}}]])
+        
+        # Regex patterns, compiled once (matched case-insensitively)
+        self.compiled = [
+            (entity_type, re.compile(pattern, re.IGNORECASE))
+            for entity_type, patterns in self.patterns.items()
+            for pattern in patterns
+        ]
     
-    def _initialize_patterns(self) -> Dict[ScientificEntityType, List[str]]:
-        """Initialize regex patterns for entity extraction."""
+    def _initialize_terms(self) -> Dict[ScientificEntityType, List[str]]:
+        """Initialize literal keywords for entity extraction (matched case-insensitively)."""
         return {
             ScientificEntityType.METHOD: [
-                r'\b(?:algorithm|approach|method|technique|model|framework|system|architecture)\b',
-                r'\b(?:neural network|deep learning|machine learning|SVM|CNN|RNN|LSTM|transformer)\b',
-                r'\b(?:classification|regression|clustering|segmentation|detection)\b',
+                'algorithm', 'approach', 'method', 'technique', 'model', 'framework', 'system', 'architecture',
+                'neural network', 'deep learning', 'machine learning', 'SVM', 'CNN', 'RNN', 'LSTM', 'transformer',
+                'classification', 'regression', 'clustering', 'segmentation', 'detection',
             ],
             ScientificEntityType.METRIC: [
-                r'\b(?:accuracy|precision|recall|F1[- ]score|AUC|ROC)\b',
-                r'\b(?:RMSE|MAE|MSE|error rate|performance)\b',
-                r'\b(?:\d+(?:\.\d+)?%)\b',  # Percentages
+                'accuracy', 'precision', 'recall', 'F1-score', 'F1 score', 'AUC', 'ROC',
+                'RMSE', 'MAE', 'MSE', 'error rate', 'performance',
             ],
             ScientificEntityType.MATERIAL: [
-                r'\b(?:dataset|corpus|benchmark|database)\b',
-                r'\b(?:MNIST|ImageNet|COCO|TIMIT|LibriSpeech)\b',
-                r'\b(?:training set|test set|validation set)\b',
+                'dataset', 'corpus', 'benchmark', 'database',
+                'MNIST', 'ImageNet', 'COCO', 'TIMIT', 'LibriSpeech',
+                'training set', 'test set', 'validation set',
             ],
             ScientificEntityType.TASK: [
-                r'\b(?:recognition|detection|classification|prediction|estimation)\b',
-                r'\b(?:speech recognition|image classification|object detection)\b',
-                r'\b(?:problem|task|challenge)\b',
+                'recognition', 'detection', 'classification', 'prediction', 'estimation',
+                'speech recognition', 'image classification', 'object detection',
+                'problem', 'task', 'challenge',
             ],
             ScientificEntityType.TOOL: [
-                r'\b(?:TensorFlow|PyTorch|Keras|scikit-learn|MATLAB)\b',
-                r'\b(?:Python|Java|C\+\+|R)\b',
-                r'\b(?:GPU|CPU|FPGA|embedded system)\b',
+                'TensorFlow', 'PyTorch', 'Keras', 'scikit-learn', 'MATLAB',
+                'Python', 'Java', 'C++', 'R',
+                'GPU', 'CPU', 'FPGA', 'embedded system',
             ],
         }
     
-    def extract_entities(self, text: str) -> List[ScientificEntity]:
+    def _initialize_patterns(self) -> Dict[ScientificEntityType, List[str]]:
+        """Initialize regex patterns for entities that are not fixed keywords."""
+        return {
+            ScientificEntityType.METRIC: [
+                r'\b(?:\d+(?:\.\d+)?%)\b',  # Percentages
+            ],
+        }
+    
+    def extract_entities(self, text: Union[str, Doc]) -> List[ScientificEntity]:
         """
         Extract scientific entities from text.
         
         Args:
-            text: Input text to analyze
+            text: Input text to analyze, or a Doc already processed by self.nlp
             
         Returns:
             List of extracted ScientificEntity objects
         """
-        entities = []
-        doc = self.nlp(text)
+        doc = text if isinstance(text, Doc) else self.nlp(text)
+        text = doc.text
+        find_context = self._sentence_lookup(doc)
+        
+        # Entities are deduplicated as they are found, keyed by lowercased
+        # text and type; the highest confidence entry is kept
+        entities: Dict[Tuple[str, ScientificEntityType], ScientificEntity] = {}
+        
+        # Extract keyword entities from the tokens
+        for match_id, start, end in self.phrase_matcher(doc):
+            span = doc[start:end]
+            entity_type = ScientificEntityType[self.nlp.vocab.strings[match_id]]
+            key = (span.text.lower(), entity_type)
+            if key not in entities:
+                entities[key] = ScientificEntity(
+                    text=span.text,
+                    entity_type=entity_type,
+                    context=span.sent.text,
+                    confidence=0.8  # Pattern-based confidence
+                )
+        
+        # Extract keywords at the start of longer tokens ("ImageNet-1k")
+        for match_id, start, end in self.prefix_matcher(doc):
+            token = doc[start]
+            entity_type = ScientificEntityType[self.nlp.vocab.strings[match_id]]
+            prefix = self.term_prefixes[entity_type].match(token.lower_)
+            matched_text = token.text[:prefix.end()]
+            key = (matched_text.lower(), entity_type)
+            if key not in entities:
+                entities[key] = ScientificEntity(
+                    text=matched_text,
+                    entity_type=entity_type,
+                    context=token.sent.text,
+                    confidence=0.8  # Pattern-based confidence
+                )
         
         # Extract entities using pattern matching
-        for entity_type, patterns in self.patterns.items():
-            for pattern in patterns:
-                for match in re.finditer(pattern, text, re.IGNORECASE):
-                    matched_text = match.group(0)
-                    
-                    # Find containing sentence
-                    context = self._find_sentence_context(text, match.start())
-                    
-                    entities.append(ScientificEntity(
-                        text=matched_text,
-                        entity_type=entity_type,
-                        context=context,
-                        confidence=0.8  # Pattern-based confidence
-                    ))
-        
-        # Extract noun phrases as potential concepts
-        for chunk in doc.noun_chunks:
+        for entity_type, regex in self.compiled:
+            for match in regex.finditer(text):
+                matched_text = match.group()
+                key = (matched_text.lower(), entity_type)
+                if key in entities and entities[key].confidence >= 0.8:
+                    continue
+                
+                entities[key] = ScientificEntity(
+                    text=matched_text,
+                    entity_type=entity_type,
+                    context=find_context(match.start()),  # Containing sentence
+                    confidence=0.8  # Pattern-based confidence
+                )
+        
+        # Extract noun phrases as potential concepts (needs a dependency parse)
+        for chunk in _noun_chunks(doc):
             # Filter for technical-looking noun phrases
             if len(chunk.text.split()) >= 2 and chunk.text[0].isupper():
-                context = str(chunk.sent)
-                entities.append(ScientificEntity(
+                key = (chunk.text.lower(), ScientificEntityType.CONCEPT)
+                if key in entities and entities[key].confidence >= 0.6:
+                    continue
+                
+                entities[key] = ScientificEntity(
                     text=chunk.text,
                     entity_type=ScientificEntityType.CONCEPT,
-                    context=context,
+                    context=str(chunk.sent),
                     confidence=0.6
-                ))
-        
-        # Deduplicate entities
-        entities = self._deduplicate_entities(entities)
+                )
         
-        return entities
+        return list(entities.values())
     
-    def _find_sentence_context(self, text: str, position: int) -> str:
-        """Find the sentence containing a given character position."""
-        sentences = sent_tokenize(text)
-        current_pos = 0
-        
-        for sentence in sentences:
-            sentence_end = current_pos + len(sentence)
-            if current_pos <= position < sentence_end:
-                return sentence
-            current_pos = sentence_end + 1  # +1 for space
-        
-        return ""
-    
-    def _deduplicate_entities(self, entities: List[ScientificEntity]) -> List[ScientificEntity]:
-        """Remove duplicate entities, keeping highest confidence."""
-        seen = {}
+    def _sentence_lookup(self, doc: Doc) -> Callable[[int], str]:
+        """
+        Build a lookup from character position to the text of its sentence.
+        
+        Sentence boundaries come from the Doc (no re-tokenization); each
+        lookup is a binary search over sentence start offsets.
+        """
+        sentences = list(doc.sents)
+        starts = [sent.start_char for sent in sentences]
         
-        for entity in entities:
-            key = (entity.text.lower(), entity.entity_type)
-            if key not in seen or entity.confidence > seen[key].confidence:
-                seen[key] = entity
+        def find_context(position: int) -> str:
+            index = bisect.bisect_right(starts, position) - 1
+            return sentences[index].text if index >= 0 else ""
         
-        return list(seen.values())
+        return find_context
 
 
 class DiscourseSegmenter:
@@ -206,7 +347,27 @@ class DiscourseSegmenter:
     
     def __init__(self):
         """Initialize the discourse segmenter."""
+        # Rule-based sentence splitter for raw text (no tagger/parser needed)
+        self.nlp = spacy.blank("en")
+        self.nlp.add_pipe("sentencizer")
+        
         self.function_indicators = self._initialize_indicators()
+        
+        # Scores are kept in a NumPy vector indexed by position in _fn_list;
+        # each indicator maps to the indices of the functions it supports
+        self._fn_list = list(RhetoricalFunction)
+        self._fn_index = {function: i for i, function in enumerate(self._fn_list)}
+        self._indicator_to_fn: Dict[str, List[int]] = {}
+        for function, indicators in self.function_indicators.items():
+            for indicator in indicators:
+                self._indicator_to_fn.setdefault(indicator, []).append(self._fn_index[function])
+        
+        # Aho-Corasick automaton over all indicators, so each sentence is
+        # scanned once regardless of how many indicators there are. Both
+        # paths match indicators as substrings ("framework" in "frameworks").
+        self.automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self.automaton = _build_automaton(self._indicator_to_fn)
     
     def _initialize_indicators(self) -> Dict[RhetoricalFunction, List[str]]:
         """Initialize keyword indicators for each rhetorical function."""
@@ -241,18 +402,24 @@ class DiscourseSegmenter:
             ],
         }
     
-    def segment(self, text: str, section_type: Optional[str] = None) -> List[AnnotatedSentence]:
+    def segment(
+        self,
+        text: Union[str, Doc],
+        section_type: Optional[str] = None
+    ) -> List[AnnotatedSentence]:
         """
         Segment text into sentences with rhetorical function annotations.
         
         Args:
-            text: Input text to segment
+            text: Input text to segment, or a Doc that already has sentence boundaries
             section_type: Optional section type hint (e.g., 'methodology', 'results')
             
         Returns:
             List of AnnotatedSentence objects
         """
-        sentences = sent_tokenize(text)
+        doc = text if isinstance(text, Doc) else self.nlp(text)
+        sentences = [sent.text.strip() for sent in doc.sents]
+        sentences = [sentence for sentence in sentences if sentence]
         annotated = []
         
         for i, sentence in enumerate(sentences):
@@ -287,96 +454,115 @@ class DiscourseSegmenter:
             Tuple of (RhetoricalFunction, confidence)
         """
         sentence_lower = sentence.lower()
-        scores = {func: 0.0 for func in RhetoricalFunction}
         
-        # Score based on keyword indicators
-        for function, indicators in self.function_indicators.items():
-            for indicator in indicators:
+        # Function indices hit by keyword indicators (each indicator counts once)
+        hit_fn_ids: List[int] = []
+        if self.automaton is not None:
+            found = {value for _, value in self.automaton.iter(sentence_lower)}
+            for _, fn_ids in found:
+                hit_fn_ids.extend(fn_ids)
+        else:
+            for indicator, fn_ids in self._indicator_to_fn.items():
                 if indicator in sentence_lower:
-                    scores[function] += 1.0
+                    hit_fn_ids.extend(fn_ids)
+        
+        scores = np.zeros(len(self._fn_list))
+        np.add.at(scores, np.asarray(hit_fn_ids, dtype=np.intp), 1.0)
+        index = self._fn_index
         
         # Boost based on section type
         if section_type:
             section_type = section_type.lower()
             if 'method' in section_type:
-                scores[RhetoricalFunction.METHOD] += 2.0
+                scores[index[RhetoricalFunction.METHOD]] += 2.0
             elif 'result' in section_type:
-                scores[RhetoricalFunction.RESULT] += 2.0
+                scores[index[RhetoricalFunction.RESULT]] += 2.0
             elif 'conclusion' in section_type:
-                scores[RhetoricalFunction.CONCLUSION] += 2.0
+                scores[index[RhetoricalFunction.CONCLUSION]] += 2.0
             elif 'introduction' in section_type or 'background' in section_type:
-                scores[RhetoricalFunction.BACKGROUND] += 1.0
-                scores[RhetoricalFunction.OBJECTIVE] += 1.0
+                scores[index[RhetoricalFunction.BACKGROUND]] += 1.0
+                scores[index[RhetoricalFunction.OBJECTIVE]] += 1.0
         
         # Position-based heuristics
         relative_pos = position / max(total, 1)
         if relative_pos < 0.2:  # Early in document
-            scores[RhetoricalFunction.BACKGROUND] += 0.5
-            scores[RhetoricalFunction.OBJECTIVE] += 0.5
+            scores[index[RhetoricalFunction.BACKGROUND]] += 0.5
+            scores[index[RhetoricalFunction.OBJECTIVE]] += 0.5
         elif relative_pos > 0.8:  # Late in document
-            scores[RhetoricalFunction.CONCLUSION] += 0.5
-            scores[RhetoricalFunction.FUTURE_WORK] += 0.3
+            scores[index[RhetoricalFunction.CONCLUSION]] += 0.5
+            scores[index[RhetoricalFunction.FUTURE_WORK]] += 0.3
         
-        # Find best match
-        max_score = max(scores.values())
+        # Find best match (argmax keeps the first function on ties)
+        best = int(scores.argmax())
+        max_score = float(scores[best])
         if max_score == 0:
             return RhetoricalFunction.UNKNOWN, 0.0
         
-        best_function = max(scores.items(), key=lambda x: x[1])[0]
         confidence = min(max_score / 3.0, 1.0)  # Normalize confidence
         
-        return best_function, confidence
+        return self._fn_list[best], confidence
 
 
 class KeyPhraseExtractor:
     """Extract key phrases from scientific text."""
     
-    def __init__(self):
-        """Initialize the key phrase extractor."""
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            import subprocess
-            subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-            self.nlp = spacy.load("en_core_web_sm")
-        
-        self.stop_words = set(stopwords.words('english'))
+    def __init__(self, nlp: Optional[Language] = None):
+        """
+        Initialize the key phrase extractor.
+        
+        Args:
+            nlp: spaCy pipeline to use (loaded if not provided)
+        """
+        self.nlp = nlp or _load_nlp()
+        
+        self.stop_words = _load_stopwords()
+        
+        # Results by (text, max_phrases), oldest evicted first
+        self._cache: Dict[Tuple[str, int], List[Tuple[str, float]]] = {}
     
-    def extract(self, text: str, max_phrases: int = 20) -> List[Tuple[str, float]]:
+    def extract(self, text: Union[str, Doc], max_phrases: int = 20) -> List[Tuple[str, float]]:
         """
         Extract key phrases from text.
         
         Args:
-            text: Input text
+            text: Input text, or a Doc already processed by self.nlp
             max_phrases: Maximum number of phrases to return
             
         Returns:
             List of (phrase, score) tuples, sorted by score
         """
-        doc = self.nlp(text)
+        key = (text.text if isinstance(text, Doc) else text, max_phrases)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return list(cached)
+        
+        doc = text if isinstance(text, Doc) else self.nlp(text)
         
         # Extract noun phrases
-        phrases = {}
+        phrases: Counter = Counter()
         
-        for chunk in doc.noun_chunks:
-            # Filter out stop words and short phrases
-            if len(chunk.text.split()) < 2:
+        stop_words = self.stop_words
+        for chunk in _noun_chunks(doc):
+            # Filter out stop words and short phrases (one lower/split per chunk)
+            phrase_lower = chunk.text.lower()
+            words = phrase_lower.split()
+            if len(words) < 2:
                 continue
             
-            phrase_lower = chunk.text.lower()
-            if all(word in self.stop_words for word in phrase_lower.split()):
+            if all(word in stop_words for word in words):
                 continue
             
             # Score based on frequency and position
-            if phrase_lower not in phrases:
-                phrases[phrase_lower] = 0.0
-            
             phrases[phrase_lower] += 1.0
         
-        # Sort by score
-        sorted_phrases = sorted(phrases.items(), key=lambda x: x[1], reverse=True)
+        # Top phrases by score (ties keep first-seen order, like a stable sort)
+        top_phrases = heapq.nlargest(max_phrases, phrases.items(), key=operator.itemgetter(1))
+        
+        if len(self._cache) >= KEYPHRASE_CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = top_phrases
         
-        return sorted_phrases[:max_phrases]
+        return list(top_phrases)
 
 
 class NLPProcessor:
@@ -390,10 +576,58 @@ class NLPProcessor:
     """
     
     def __init__(self):
-        """Initialize the NLP processor."""
-        self.ner = ScientificNER()
-        self.segmenter = DiscourseSegmenter()
-        self.keyphrase_extractor = KeyPhraseExtractor()
+        """
+        Initialize the NLP processor.
+        
+        Components (and the spaCy model) are built on first use, so creating
+        a processor that is never used costs nothing.
+        """
+        self._nlp: Optional[Language] = None
+        self._ner: Optional[ScientificNER] = None
+        self._segmenter: Optional[DiscourseSegmenter] = None
+        self._keyphrase_extractor: Optional[KeyPhraseExtractor] = None
+    
+    def load(self) -> "NLPProcessor":
+        """
+        Build all components now instead of on first use.
+        
+        Useful for surfacing load errors (missing model or NLTK data) early.
+        
+        Returns:
+            This processor
+        """
+        self.ner
+        self.segmenter
+        self.keyphrase_extractor
+        return self
+    
+    @property
+    def nlp(self) -> Language:
+        """spaCy pipeline shared by all components."""
+        if self._nlp is None:
+            self._nlp = _load_nlp()
+        return self._nlp
+    
+    @property
+    def ner(self) -> ScientificNER:
+        """Scientific entity extractor."""
+        if self._ner is None:
+            self._ner = ScientificNER(self.nlp)
+        return self._ner
+    
+    @property
+    def segmenter(self) -> DiscourseSegmenter:
+        """Discourse segmenter."""
+        if self._segmenter is None:
+            self._segmenter = DiscourseSegmenter()
+        return self._segmenter
+    
+    @property
+    def keyphrase_extractor(self) -> KeyPhraseExtractor:
+        """Key phrase extractor."""
+        if self._keyphrase_extractor is None:
+            self._keyphrase_extractor = KeyPhraseExtractor(self.nlp)
+        return self._keyphrase_extractor
     
     def process(self, text: str, section_type: Optional[str] = None) -> Dict:
         """
@@ -406,8 +640,78 @@ class NLPProcessor:
         Returns:
             Dictionary containing all NLP analysis results
         """
+        # Run the spaCy pipeline once and reuse the Doc
+        return self._process_doc(self.nlp(text), section_type)
+    
+    def process_batch(
+        self,
+        texts: List[str],
+        section_types: Optional[List[Optional[str]]] = None
+    ) -> List[Dict]:
+        """
+        Process several texts with all NLP components in one spaCy pass.
+        
+        Texts are streamed through nlp.pipe so the tagger and parser run on
+        minibatches (size set by PAPER_SPACY_BATCH_SIZE) instead of one call
+        per text. Large inputs (see PARALLEL_MIN_CHARS) are processed in a
+        shared pool of worker processes instead; workers load SPACY_MODEL.
+        
+        Args:
+            texts: Input texts to process
+            section_types: Optional section type hint per text
+            
+        Returns:
+            List of result dictionaries, in the same order as texts
+        """
+        if section_types is None:
+            section_types = [None] * len(texts)
+        
+        # Large inputs: sections are independent, so spread them over processes
+        workers = min(PARALLEL_MAX_WORKERS, os.cpu_count() or 1)
+        if (
+            workers > 1
+            and len(texts) > PARALLEL_MIN_TEXTS
+            and sum(len(t) for t in texts) > PARALLEL_MIN_CHARS
+        ):
+            return list(_get_pool(workers).map(_process_one, zip(texts, section_types)))
+        
+        docs = self.nlp.pipe(texts, batch_size=SPACY_BATCH_SIZE)
+        return [
+            self._process_doc(doc, section_type)
+            for doc, section_type in zip(docs, section_types)
+        ]
+    
+    def _process_doc(self, doc: Doc, section_type: Optional[str]) -> Dict:
+        """Run all components over an already processed Doc."""
         return {
-            'entities': self.ner.extract_entities(text),
-            'discourse': self.segmenter.segment(text, section_type),
-            'key_phrases': self.keyphrase_extractor.extract(text),
+            'entities': self.ner.extract_entities(doc),
+            'discourse': self.segmenter.segment(doc, section_type),
+            'key_phrases': self.keyphrase_extractor.extract(doc),
         }
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared NLP worker pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Workers are spawned, not forked: forking a process that already
+            # runs threads (web server, numba) can deadlock the children
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+@functools.lru_cache(maxsize=1)
+def _worker_processor() -> NLPProcessor:
+    """NLPProcessor reused by every task run in one worker process."""
+    return NLPProcessor()
+
+
+def _process_one(item: Tuple[str, Optional[str]]) -> Dict:
+    """Process one (text, section_type) pair in a worker process."""
+    text, section_type = item
+    return _worker_processor().process(text, section_type)
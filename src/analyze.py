@@ -15,7 +15,6 @@ from rich.markdown import Markdown
 from rich.table import Table
 
 from src.ingestion import SimplePDFParser
-from src.analysis import AcademicAnalyzer
 
 console = Console()
 
@@ -128,7 +127,10 @@ def main():
         
         console.print("[green]✓[/green] PDF parsed successfully")
         
-        # Perform academic analysis
+        # Perform academic analysis (imported here so the NLP stack is only
+        # loaded once there is a parsed paper to analyze)
+        from src.analysis import AcademicAnalyzer
+        
         with console.status("[bold green]Performing academic analysis..."):
             analyzer = AcademicAnalyzer()
             analysis = analyzer.analyze(paper)
@@ -7,6 +7,9 @@ from pathlib import Path
 
 from src.models.paper import Paper
 
+# File extensions accepted by validate_pdf (compared lowercased)
+_PDF_SUFFIXES = frozenset({".pdf"})
+
 
 class AbstractParser(ABC):
     """
@@ -48,5 +51,5 @@ class AbstractParser(ABC):
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
-        if pdf_path.suffix.lower() != ".pdf":
+        if pdf_path.suffix.lower() not in _PDF_SUFFIXES:
             raise ValueError(f"File is not a PDF: {pdf_path}")
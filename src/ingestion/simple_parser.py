@@ -1,22 +1,225 @@
 """
-Simple PDF parser implementation using PyPDF.
+Simple PDF parser implementation using PyMuPDF, or PyPDF as a fallback.
 
 This is a fallback parser that extracts basic text content.
 For production use, prefer Grobid or Nougat for better structure preservation.
 """
 
+import atexit
+import hashlib
+import itertools
+import multiprocessing
+import os
 import re
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from importlib import metadata
 from pathlib import Path
+from typing import Iterable, Optional
 
 from pypdf import PdfReader
 
+try:
+    import pymupdf
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+try:
+    import pypdfium2
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
 from src.ingestion.base_parser import AbstractParser
 from src.models.paper import Author, Paper, Section, SectionType
 
 
+# Common section headers in academic papers (Multi-disciplinary)
+# Supports: Engineering, Medicine, Social Sciences, etc.
+# Matched case-insensitively against stripped lines.
+_RAW_SECTION_PATTERNS = {
+    SectionType.ABSTRACT: r"^\s*(?:(?:\d+|[IVX]+)\.?\s*)?(abstract|resumen|summary|executive\s+summary)\s*[:.-]?\s*$",
+    
+    SectionType.INTRODUCTION: r"^\s*(?:(?:\d+|[IVX]+)\.?\s*)?(introduction|introducción|background|motivation|overview|preliminaries|problem\s+statement|context)\s*[:.-]?\s*$",
+    
+    # Engineering & Tech: System Model, Architecture, Proposed Method
+    # Medicine: Materials and Methods, Patients and Methods, Clinical Study
+    # General: Methodology, Approach
+    SectionType.METHODOLOGY: r"^\s*(?:(?:\d+|[IVX]+)\.?\s*)?(methodology|methods?|materials?\s+and\s+methods?|experimental\s+setup|approach|implementation|system\s+design|architecture|system\s+model|proposed\s+method|algorithm|procedure|study\s+design|participants?|protocol)\s*[:.-]?\s*$",
+    
+    # Engineering: Performance Evaluation, Simulation Results
+    # Medicine: Clinical Outcomes, Findings
+    SectionType.RESULTS: r"^\s*(?:(?:\d+|[IVX]+)\.?\s*)?(results?|findings|experimental\s+results?|experiments?|evaluations?|performance|outcomes?|simulation\s+results?|analysis\s+of\s+results)\s*[:.-]?\s*$",
+    
+    # Social Sciences: Theoretical Framework, Lit Review often separate but related
+    SectionType.DISCUSSION: r"^\s*(?:(?:\d+|[IVX]+)\.?\s*)?(discussion|analysis|interpretation|limitations?|implications?|theoretical\s+framework|literature\s+review|related\s+work)\s*[:.-]?\s*$",
+    
+    SectionType.CONCLUSION: r"^\s*(?:(?:\d+|[IVX]+)\.?\s*)?(conclusion|conclusions|concluding\s+remarks|summary|future\s+work|recommendations?)\s*[:.-]?\s*$",
+    
+    SectionType.REFERENCES: r"^\s*(?:(?:\d+|[IVX]+)\.?\s*)?(references?|bibliography|works?\s+cited|sources?)\s*[:.-]?\s*$",
+}
+
+# All header patterns as one alternation with a named group per section
+# type, so a candidate line is tested with a single match. Alternatives
+# keep the dict order, so the first matching type still wins.
+_SECTION_HEADER = re.compile(
+    "|".join(f"(?P<{section_type.name}>{pattern})" for section_type, pattern in _RAW_SECTION_PATTERNS.items()),
+    re.IGNORECASE,
+)
+
+
+# With SimplePDFParser(parallel=True), PyMuPDF documents with at least this
+# many pages have their text extracted in worker processes. PyMuPDF is not
+# thread-safe, so each worker opens the file itself and reads a contiguous
+# range of pages. Off by default: starting the spawned workers costs ~2 s
+# (each re-imports pymupdf, pypdf and pydantic), far more than sequential
+# extraction of a typical paper, so it only pays off in long-running
+# processes that parse many large documents.
+PARALLEL_MIN_PAGES = 16
+PARALLEL_MAX_WORKERS = 8
+
+# Parsed papers are cached as JSON files keyed by a hash of the PDF bytes.
+# Least recently used entries are removed beyond PARSE_CACHE_MAX_ENTRIES.
+PARSE_CACHE_DIR = Path.home() / ".cache" / "paper-collector" / "parsed"
+PARSE_CACHE_MAX_ENTRIES = 256
+
+# Distribution behind each backend; its version is part of the cache key
+_BACKEND_DISTRIBUTIONS = {"pymupdf": "pymupdf", "pdfium": "pypdfium2", "pypdf": "pypdf"}
+
+# Page extraction pool, created on first use and kept for the process
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_lock = threading.Lock()
+
+# Separators between names in the PDF "/Author" metadata field
+_AUTHOR_SPLIT = re.compile(r"[,;]|\sand\s")
+
+
+@dataclass(slots=True)
+class _SectionState:
+    """Running state of the streaming section detector."""
+
+    sections: list[Section] = field(default_factory=list)
+    section_type: SectionType = SectionType.OTHER
+    title: Optional[str] = None
+    content: list[str] = field(default_factory=list)
+
+    def flush(self) -> None:
+        """Close the current section, if it has any content."""
+        if self.content:
+            # Parser output is already typed; skip validation
+            self.sections.append(Section.model_construct(
+                section_type=self.section_type,
+                title=self.title,
+                content="\n".join(self.content).strip()
+            ))
+
+
+class _PyMuPDFPage:
+    """PyMuPDF page exposing the pypdf page text interface."""
+
+    def __init__(self, document, index: int) -> None:
+        self._document = document
+        self._index = index
+
+    def extract_text(self) -> str:
+        # Loaded on demand and dropped after, so only one page is alive at a time
+        return self._document.load_page(self._index).get_text("text")
+
+
+class _PyMuPDFReader:
+    """
+    PyMuPDF document exposing the parts of the pypdf PdfReader interface
+    the parser uses (metadata with "/Title"-style keys, and pages).
+    """
+
+    def __init__(self, path: str) -> None:
+        self._document = pymupdf.open(path)
+        metadata = self._document.metadata or {}
+        self.metadata = {
+            "/Title": metadata.get("title"),
+            "/Author": metadata.get("author"),
+        }
+        self.pages = [_PyMuPDFPage(self._document, i) for i in range(self._document.page_count)]
+
+    def close(self) -> None:
+        self._document.close()
+
+
+class _PdfiumPage:
+    """pypdfium2 page exposing the pypdf page text interface."""
+
+    def __init__(self, document, index: int) -> None:
+        self._document = document
+        self._index = index
+
+    def extract_text(self) -> str:
+        # Pages are loaded on demand and released right after, so only one
+        # page's PDFium objects are alive at a time
+        page = self._document[self._index]
+        textpage = page.get_textpage()
+        try:
+            return textpage.get_text_range()
+        finally:
+            textpage.close()
+            page.close()
+
+
+class _PdfiumReader:
+    """
+    pypdfium2 document exposing the parts of the pypdf PdfReader interface
+    the parser uses (metadata with "/Title"-style keys, and pages).
+    """
+
+    def __init__(self, path: str) -> None:
+        self._document = pypdfium2.PdfDocument(path)
+        metadata = self._document.get_metadata_dict()
+        self.metadata = {
+            "/Title": metadata.get("Title"),
+            "/Author": metadata.get("Author"),
+        }
+        self.pages = [_PdfiumPage(self._document, i) for i in range(len(self._document))]
+
+    def close(self) -> None:
+        self._document.close()
+
+
+def _backend_version(backend: str) -> str:
+    """Installed version of a backend's library, or "unknown"."""
+    try:
+        return metadata.version(_BACKEND_DISTRIBUTIONS[backend])
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _extract_page_range(task: tuple[str, int, int]) -> list[str]:
+    """Extract the text of pages [start, stop) in a worker process."""
+    path, start, stop = task
+    with pymupdf.open(path) as document:
+        return [document[i].get_text("text") for i in range(start, stop)]
+
+
+def _get_page_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared page extraction pool, creating it on first use."""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            # Workers are spawned, not forked: forking a process that already
+            # runs threads (web server, numba) can deadlock the children
+            _page_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            atexit.register(_page_pool.shutdown)
+        return _page_pool
+
+
 class SimplePDFParser(AbstractParser):
     """
-    Basic PDF parser using PyPDF library.
+    Basic PDF parser using PyMuPDF (or pypdfium2, or PyPDF) for text extraction.
     
     Limitations:
     - Cannot reliably detect section boundaries
@@ -26,52 +229,125 @@ class SimplePDFParser(AbstractParser):
     This parser serves as a baseline and fallback option.
     """
 
-    # Common section headers in academic papers (Multi-disciplinary)
-    # Supports: Engineering, Medicine, Social Sciences, etc.
+    # Section header patterns, compiled once at class creation
     SECTION_PATTERNS = {
-        SectionType.ABSTRACT: r"(?i)^\s*(?:(?:\d+|[IVX]+)\.?\s*)?(abstract|resumen|summary|executive\s+summary)\s*[:.-]?\s*$",
-        
-        SectionType.INTRODUCTION: r"(?i)^\s*(?:(?:\d+|[IVX]+)\.?\s*)?(introduction|introducción|background|motivation|overview|preliminaries|problem\s+statement|context)\s*[:.-]?\s*$",
-        
-        # Engineering & Tech: System Model, Architecture, Proposed Method
-        # Medicine: Materials and Methods, Patients and Methods, Clinical Study
-        # General: Methodology, Approach
-        SectionType.METHODOLOGY: r"(?i)^\s*(?:(?:\d+|[IVX]+)\.?\s*)?(methodology|methods?|materials?\s+and\s+methods?|experimental\s+setup|approach|implementation|system\s+design|architecture|system\s+model|proposed\s+method|algorithm|procedure|study\s+design|participants?|protocol)\s*[:.-]?\s*$",
-        
-        # Engineering: Performance Evaluation, Simulation Results
-        # Medicine: Clinical Outcomes, Findings
-        SectionType.RESULTS: r"(?i)^\s*(?:(?:\d+|[IVX]+)\.?\s*)?(results?|findings|experimental\s+results?|experiments?|evaluations?|performance|outcomes?|simulation\s+results?|analysis\s+of\s+results)\s*[:.-]?\s*$",
-        
-        # Social Sciences: Theoretical Framework, Lit Review often separate but related
-        SectionType.DISCUSSION: r"(?i)^\s*(?:(?:\d+|[IVX]+)\.?\s*)?(discussion|analysis|interpretation|limitations?|implications?|theoretical\s+framework|literature\s+review|related\s+work)\s*[:.-]?\s*$",
-        
-        SectionType.CONCLUSION: r"(?i)^\s*(?:(?:\d+|[IVX]+)\.?\s*)?(conclusion|conclusions|concluding\s+remarks|summary|future\s+work|recommendations?)\s*[:.-]?\s*$",
-        
-        SectionType.REFERENCES: r"(?i)^\s*(?:(?:\d+|[IVX]+)\.?\s*)?(references?|bibliography|works?\s+cited|sources?)\s*[:.-]?\s*$",
+        section_type: re.compile(pattern, re.IGNORECASE)
+        for section_type, pattern in _RAW_SECTION_PATTERNS.items()
     }
 
+    BACKENDS = ("pymupdf", "pdfium", "pypdf")
+    # Part of the parse cache key: bump whenever parser output changes
+    PARSER_VERSION = "simple-0.3.0-optimized"
+
+    def __init__(self, backend: str = "pymupdf", parallel: bool = False, cache: bool = False):
+        """
+        Initialize the parser.
+        
+        Args:
+            backend: Text extraction library, "pymupdf" (fastest), "pdfium"
+                (pypdfium2) or "pypdf". Falls back to "pypdf" when the chosen
+                library is not installed.
+            parallel: Extract the pages of long documents (PARALLEL_MIN_PAGES
+                or more) in worker processes. PyMuPDF backend only. Workers
+                are spawned and re-import the calling script, so a script
+                that parses at module level must do so under an
+                `if __name__ == "__main__":` guard.
+            cache: Reuse earlier results for PDFs with identical content.
+                Stored under PAPER_PARSE_CACHE_DIR (default PARSE_CACHE_DIR),
+                keeping at most PARSE_CACHE_MAX_ENTRIES entries.
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown PDF backend: {backend}")
+        if (backend == "pymupdf" and not PYMUPDF_AVAILABLE) or (backend == "pdfium" and not PDFIUM_AVAILABLE):
+            backend = "pypdf"
+        self.backend = backend
+        self.parallel = parallel
+        self.cache_dir = Path(os.getenv("PAPER_PARSE_CACHE_DIR", PARSE_CACHE_DIR)).expanduser() if cache else None
+        self._cache_tag = f"{backend}-{_backend_version(backend)}-{self.PARSER_VERSION}" if cache else None
+
     def parse(self, pdf_path: Path) -> Paper:
         """
         Parse PDF and extract text with basic section detection.
         """
         self.validate_pdf(pdf_path)
         
-        reader = PdfReader(str(pdf_path))
+        if self.cache_dir is None:
+            return self._parse_uncached(pdf_path)
         
+        cache_path = self._cache_path(pdf_path)
+        if cache_path.exists():
+            try:
+                paper = Paper.model_validate_json(cache_path.read_bytes())
+                os.utime(cache_path)  # Mark as recently used for pruning
+                return paper.model_copy(update={
+                    "source_file": str(pdf_path),
+                    "ingestion_timestamp": datetime.now(timezone.utc),
+                })
+            except (OSError, ValueError):
+                pass  # Unreadable or outdated entry; parse again
+        
+        paper = self._parse_uncached(pdf_path)
+        self._write_cache(cache_path, paper)
+        return paper
+
+    def _cache_path(self, pdf_path: Path) -> Path:
+        """Cache file for a PDF, keyed by its content, backend (and its version) and parser version."""
+        digest = hashlib.blake2b(pdf_path.read_bytes(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}-{self._cache_tag}.json"
+
+    def _write_cache(self, cache_path: Path, paper: Paper) -> None:
+        """Store a parsed paper; written to a temp file first so readers never see partial JSON."""
+        tmp_name = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("wb", dir=cache_path.parent, suffix=".tmp", delete=False) as tmp:
+                tmp_name = tmp.name
+                tmp.write(paper.model_dump_json().encode("utf-8"))
+            os.replace(tmp_name, cache_path)
+        except OSError:
+            # Cache is an optimization only; just don't leave the temp file behind
+            if tmp_name is not None:
+                Path(tmp_name).unlink(missing_ok=True)
+            return
+        self._prune_cache()
+
+    def _prune_cache(self) -> None:
+        """Remove the least recently used entries beyond PARSE_CACHE_MAX_ENTRIES."""
+        try:
+            entries = [(entry.stat().st_mtime, entry) for entry in self.cache_dir.glob("*.json")]
+            if len(entries) <= PARSE_CACHE_MAX_ENTRIES:
+                return
+            entries.sort()
+            for _, entry in entries[:len(entries) - PARSE_CACHE_MAX_ENTRIES]:
+                entry.unlink(missing_ok=True)
+        except OSError:
+            pass  # Another process may be pruning at the same time
+
+    def _parse_uncached(self, pdf_path: Path) -> Paper:
+        """Parse the PDF with the configured backend."""
+        if self.backend in ("pymupdf", "pdfium"):
+            reader_class = _PyMuPDFReader if self.backend == "pymupdf" else _PdfiumReader
+            reader = reader_class(str(pdf_path))
+            try:
+                return self._parse_reader(reader, pdf_path)
+            finally:
+                reader.close()
+        
+        return self._parse_reader(PdfReader(str(pdf_path)), pdf_path)
+
+    def _parse_reader(self, reader, pdf_path: Path) -> Paper:
+        """Build the Paper from an open reader (pypdf or PyMuPDF wrapper)."""
         # Extract metadata
         metadata = reader.metadata
-        title = self._extract_title(metadata, reader)
-        authors = self._extract_authors(metadata)
         
-        # Extract full text
-        full_text = ""
-        for page in reader.pages:
-            text = page.extract_text()
-            if text:
-                full_text += text + "\n"
+        # The first page doubles as the title fallback; extract it only once
+        pages = iter(self._page_texts(reader, pdf_path))
+        first_page_text = next(pages, "")
+        title = self._extract_title(metadata, first_page_text)
+        authors = self._extract_authors(metadata)
         
-        # Attempt to detect sections
-        sections = self._detect_sections(full_text)
+        # Detect sections while streaming page lines (no full-text string)
+        sections = self._sections_from_pages(itertools.chain((first_page_text,), pages))
         
         # Extract abstract if found
         abstract = None
@@ -91,27 +367,46 @@ class SimplePDFParser(AbstractParser):
             abstract=abstract,
             sections=sections,
             source_file=str(pdf_path),
-            parser_version="simple-0.2.0-optimized"
+            parser_version=self.PARSER_VERSION
         )
 
+    def _page_texts(self, reader, pdf_path: Path) -> Iterable[str]:
+        """Text of each page, in order."""
+        page_count = len(reader.pages)
+        workers = min(PARALLEL_MAX_WORKERS, os.cpu_count() or 1)
+        if (
+            self.backend == "pymupdf"
+            and self.parallel
+            and workers > 1
+            and page_count >= PARALLEL_MIN_PAGES
+        ):
+            step = -(-page_count // workers)  # ceil division
+            tasks = [
+                (str(pdf_path), start, min(start + step, page_count))
+                for start in range(0, page_count, step)
+            ]
+            pool = _get_page_pool(workers)
+            return [text for texts in pool.map(_extract_page_range, tasks) for text in texts]
+        
+        return (page.extract_text() or "" for page in reader.pages)
+
     # ... (skipping unchanged metadata methods)
 
-    def _extract_title(self, metadata: dict, reader: PdfReader) -> str:
-        """Extract title from metadata or first page."""
+    def _extract_title(self, metadata: dict, first_page_text: str) -> str:
+        """Extract title from metadata or the first page's text."""
         if metadata and metadata.get("/Title"):
             title = str(metadata["/Title"]).strip()
             if title and title.lower() != "untitled":
                 return title
         
-        # Fallback: use first non-empty line from first page
-        if reader.pages:
-            try:
-                first_page_text = reader.pages[0].extract_text()
-                lines = [line.strip() for line in first_page_text.split("\n") if line.strip()]
-                if lines:
-                    return lines[0]
-            except:
-                pass
+        # Fallback: use first non-empty line from first page. partition()
+        # stops at each newline, so the rest of the page is never split.
+        rest = first_page_text
+        while rest:
+            line, _, rest = rest.partition("\n")
+            line = line.strip()
+            if line:
+                return line
         
         return "Untitled Document"
 
@@ -120,58 +415,48 @@ class SimplePDFParser(AbstractParser):
         authors = []
         if metadata and metadata.get("/Author"):
             author_string = str(metadata["/Author"])
-            names = re.split(r"[,;]|\sand\s", author_string)
-            authors = [Author(name=name.strip()) for name in names if name.strip()]
+            names = _AUTHOR_SPLIT.split(author_string)
+            authors = [Author.model_construct(name=name) for name in map(str.strip, names) if name]
         return authors
 
     def _detect_sections(self, text: str) -> list[Section]:
         """
         Attempt to detect sections using pattern matching.
         """
-        sections = []
-        lines = text.split("\n")
-        
-        current_section_type = SectionType.OTHER
-        current_section_title = None
-        current_content = []
-        
+        return self._sections_from_lines(text.splitlines())
+
+    def _sections_from_pages(self, pages: Iterable[str]) -> list[Section]:
+        """Detect sections across page texts, one line at a time."""
+        return self._sections_from_lines(line for page in pages for line in page.splitlines())
+
+    def _sections_from_lines(self, lines: Iterable[str]) -> list[Section]:
+        """Detect sections in a stream of text lines."""
+        state = _SectionState()
         for line in lines:
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-                
-            # Heuristic: Section headers are usually short (< 10 words or < 80 chars)
-            is_potential_header = len(line_stripped) < 80 and len(line_stripped.split()) < 10
-            
-            matched_type = None
-            if is_potential_header:
-                for section_type, pattern in self.SECTION_PATTERNS.items():
-                    if re.match(pattern, line_stripped):
-                        matched_type = section_type
-                        break
-            
-            if matched_type:
-                # Save previous section if exists
-                if current_content:
-                    sections.append(Section(
-                        section_type=current_section_type,
-                        title=current_section_title,
-                        content="\n".join(current_content).strip()
-                    ))
-                
-                # Start new section
-                current_section_type = matched_type
-                current_section_title = line_stripped
-                current_content = []
-            else:
-                current_content.append(line_stripped)
+            self._feed_line(line, state)
+        state.flush()
+        return state.sections
+
+    def _feed_line(self, line: str, state: _SectionState) -> None:
+        """
+        Add one line to the section detector, starting a new section on a header.
+        """
+        line_stripped = line.strip()
+        if not line_stripped:
+            return
         
-        # Add final section
-        if current_content:
-            sections.append(Section(
-                section_type=current_section_type,
-                title=current_section_title,
-                content="\n".join(current_content).strip()
-            ))
+        # Heuristic: Section headers are usually short (< 10 words or < 80 chars).
+        # Words are counted by their separating spaces, without building a list.
+        is_potential_header = len(line_stripped) < 80 and line_stripped.count(" ") < 9
+        
+        if is_potential_header:
+            match = _SECTION_HEADER.match(line_stripped)
+            if match:
+                # Save previous section and start a new one
+                state.flush()
+                state.section_type = SectionType[match.lastgroup]
+                state.title = line_stripped
+                state.content = []
+                return
         
-        return sections
+        state.content.append(line_stripped)
@@ -4,18 +4,20 @@ Command-line interface for Paper Collector.
 This CLI provides commands for ingesting, analyzing, and managing academic papers.
 """
 
+import contextlib
+import sys
 from pathlib import Path
 from typing import Optional
 
 import typer
+from pydantic import TypeAdapter
 from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.table import Table
 
-from src.ingestion import SimplePDFParser
 from src.models.paper import Paper
 
+# Panel, Syntax, Table and the PDF parser are imported inside the code
+# that uses them, keeping `version` and `--help` fast to start.
+
 app = typer.Typer(
     name="paper-collector",
     help="Academic Research Cognitive Amplifier - AI-powered platform for scientific literature analysis",
@@ -23,6 +25,20 @@ app = typer.Typer(
 )
 console = Console()
 
+# Reused for every dump; the adapter builds its serializer once
+_PAPER_ADAPTER = TypeAdapter(Paper)
+
+try:
+    import orjson
+
+    def _dump_paper(paper: Paper) -> bytes:
+        """Serialize a paper to indented JSON bytes."""
+        return orjson.dumps(paper.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dump_paper(paper: Paper) -> bytes:
+        """Serialize a paper to indented JSON bytes."""
+        return _PAPER_ADAPTER.dump_json(paper, indent=2)
+
 
 @app.command()
 def ingest(
@@ -59,13 +75,18 @@ def ingest(
         paper-collector ingest paper.pdf
         paper-collector ingest paper.pdf -o output.json
     """
+    from src.ingestion import SimplePDFParser
+    
     console.print(f"\n[bold blue]📄 Ingesting PDF:[/bold blue] {pdf_path}")
     
     try:
         # Parse the PDF
-        parser = SimplePDFParser()
+        # The CLI starts cold for every file, so reuse earlier parses of the same PDF
+        parser = SimplePDFParser(cache=True)
         
-        with console.status("[bold green]Parsing PDF..."):
+        # The spinner repaints from a background thread; skip it when nobody sees it
+        status = console.status("[bold green]Parsing PDF...") if console.is_terminal else contextlib.nullcontext()
+        with status:
             paper = parser.parse(pdf_path)
         
         console.print("[bold green]✓[/bold green] Parsing completed successfully\n")
@@ -73,17 +94,25 @@ def ingest(
         # Display summary
         _display_paper_summary(paper, verbose)
         
+        json_bytes = _dump_paper(paper)
+        
         # Save to file if requested
         if output:
-            output.write_text(paper.model_dump_json(indent=2))
+            output.write_bytes(json_bytes)
             console.print(f"\n[bold green]✓[/bold green] Saved to: {output}")
         else:
             # Print JSON to stdout
             if verbose:
                 console.print("\n[bold]JSON Output:[/bold]")
-            json_str = paper.model_dump_json(indent=2)
-            syntax = Syntax(json_str, "json", theme="monokai", line_numbers=False)
-            console.print(syntax)
+            if console.is_terminal:
+                from rich.syntax import Syntax
+                
+                syntax = Syntax(json_bytes.decode("utf-8"), "json", theme="monokai", line_numbers=False)
+                console.print(syntax)
+            else:
+                # Piped or redirected: highlighting would be thrown away, write raw JSON
+                sys.stdout.buffer.write(json_bytes + b"\n")
+                sys.stdout.flush()
     
     except FileNotFoundError as e:
         console.print(f"[bold red]✗ Error:[/bold red] {e}")
@@ -100,6 +129,8 @@ def ingest(
 
 def _display_paper_summary(paper: Paper, verbose: bool = False) -> None:
     """Display a formatted summary of the parsed paper."""
+    from rich.panel import Panel
+    from rich.table import Table
     
     # Title panel
     console.print(Panel(
@@ -158,6 +189,8 @@ def _display_paper_summary(paper: Paper, verbose: bool = False) -> None:
 @app.command()
 def version() -> None:
     """Show version information."""
+    from rich.panel import Panel
+
     from src import __version__
     
     console.print(Panel(
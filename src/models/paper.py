@@ -2,11 +2,11 @@
 Data models for academic papers and their components.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SectionType(str, Enum):
@@ -76,14 +76,13 @@ class Paper(BaseModel):
     # Processing metadata
     source_file: Optional[str] = Field(None, description="Path to source PDF")
     ingestion_timestamp: datetime = Field(
-        default_factory=lambda: datetime.utcnow(),
+        default_factory=lambda: datetime.now(timezone.utc),
         description="When this paper was ingested"
     )
     parser_version: str = Field(default="0.1.0", description="Version of parser used")
 
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "title": "Attention Is All You Need",
                 "authors": [
@@ -92,4 +91,5 @@ class Paper(BaseModel):
                 "abstract": "The dominant sequence transduction models...",
                 "doi": "10.48550/arXiv.1706.03762"
             }
-        }
+        },
+    )
@@ -1,12 +1,17 @@
 """
 Script simple para probar el endpoint de análisis.
 """
-import requests
+from itertools import islice
+
+import httpx
 
 print("🔍 Probando endpoint /api/analyze...\n")
 
+# Un solo cliente reutiliza la conexión para health y analyze
+client = httpx.Client(base_url="http://127.0.0.1:8000", timeout=60)
+
 # Verificar health
-response = requests.get("http://127.0.0.1:8000/api/health")
+response = client.get("/api/health")
 print(f"Health check: {response.json()}\n")
 
 # Probar con un PDF de ejemplo
@@ -21,11 +26,7 @@ if len(sys.argv) > 1:
         
         with open(pdf_path, 'rb') as f:
             files = {'file': (pdf_path.name, f, 'application/pdf')}
-            response = requests.post(
-                "http://127.0.0.1:8000/api/analyze",
-                files=files,
-                timeout=60
-            )
+            response = client.post("/api/analyze", files=files)
         
         if response.status_code == 200:
             data = response.json()
@@ -52,7 +53,7 @@ if len(sys.argv) > 1:
                 # Mostrar conceptos
                 if analysis.get('key_concepts'):
                     print(f"\n💡 Conceptos clave:")
-                    for concept in list(analysis['key_concepts'].keys())[:5]:
+                    for concept in islice(analysis['key_concepts'], 5):
                         print(f"  - {concept}")
             else:
                 print("\n⚠ No se encontró 'analysis' en la respuesta")
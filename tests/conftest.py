@@ -3,3 +3,9 @@ Test configuration and fixtures.
 """
 
 import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_parse_cache(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give every test its own, empty PDF parse cache."""
+    monkeypatch.setenv("PAPER_PARSE_CACHE_DIR", str(tmp_path_factory.mktemp("parse-cache")))
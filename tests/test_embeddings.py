@@ -0,0 +1,137 @@
+"""
+Tests for semantic search over paper embeddings.
+"""
+
+import numpy as np
+import pytest
+
+from src.analysis.embeddings import (
+    EmbeddingResult,
+    ScientificEmbedder,
+    SemanticSearchEngine,
+    _quantize,
+)
+
+
+class StubEmbedder:
+    """Embedder stand-in that maps known texts to fixed vectors."""
+
+    VECTORS = {
+        "speech": [1.0, 0.0, 0.0],
+        "vision": [0.0, 1.0, 0.0],
+        "audio": [0.9, 0.1, 0.0],
+    }
+
+    def embed_text(self, text: str) -> EmbeddingResult:
+        vector = np.array(self.VECTORS[text], dtype=np.float32)
+        return EmbeddingResult(embedding=vector, model_name="stub", dimension=3)
+
+    def embed_paper(self, title: str, abstract: str, sections=None) -> EmbeddingResult:
+        return self.embed_text(title)
+
+
+class StubModel:
+    """SentenceTransformer stand-in returning float64 one-hot vectors per text."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def encode(self, texts, **kwargs) -> np.ndarray:
+        self.calls.append(list(texts))
+        return np.eye(4)[: len(texts)]
+
+
+def _make_embedder() -> ScientificEmbedder:
+    """Build a ScientificEmbedder around StubModel without loading weights."""
+    embedder = ScientificEmbedder.__new__(ScientificEmbedder)
+    embedder.model = StubModel()
+    embedder.model_name = "stub"
+    embedder.dimension = 4
+    return embedder
+
+
+def test_embed_paper_weights_title_once() -> None:
+    """Test that the title is encoded once and weighted in embedding space."""
+    embedder = _make_embedder()
+
+    result = embedder.embed_paper("Title", "Abstract", ["Methods"])
+
+    assert embedder.model.calls == [["Title", "Abstract", "Methods"]]
+    assert np.linalg.norm(result.embedding) == pytest.approx(1.0)
+    title_w, abstract_w, section_w = result.embedding[:3]
+    assert title_w == pytest.approx(2 * abstract_w)
+    assert section_w == pytest.approx(0.3 * abstract_w)
+
+
+def test_embed_texts_matrix_is_float32_contiguous() -> None:
+    """Test that batch embeddings come back as one C-contiguous float32 matrix."""
+    embedder = _make_embedder()
+
+    matrix = embedder.embed_texts_matrix(["a", "b"])
+
+    assert matrix.shape == (2, 4)
+    assert matrix.dtype == np.float32
+    assert matrix.flags["C_CONTIGUOUS"]
+
+
+def test_search_empty_index() -> None:
+    """Test that searching an empty index returns no results."""
+    engine = SemanticSearchEngine(StubEmbedder())
+
+    assert engine.search("speech") == []
+
+
+def test_search_ranks_by_similarity() -> None:
+    """Test that search returns papers ordered by cosine similarity."""
+    engine = SemanticSearchEngine(StubEmbedder())
+    engine.index_paper("p1", "vision", "Abstract 1")
+    engine.index_paper("p2", "speech", "Abstract 2")
+
+    results = engine.search("audio", top_k=2)
+
+    assert [r["id"] for r in results] == ["p2", "p1"]
+    assert results[0]["similarity"] > results[1]["similarity"]
+    assert 0.0 <= results[1]["similarity"] <= 1.0
+
+
+def test_search_after_reindexing() -> None:
+    """Test that papers indexed after a search are included in the next one."""
+    engine = SemanticSearchEngine(StubEmbedder())
+    engine.index_paper("p1", "vision", "Abstract 1")
+    engine.search("speech")
+
+    engine.index_paper("p2", "speech", "Abstract 2")
+    results = engine.search("speech", top_k=1)
+
+    assert results[0]["id"] == "p2"
+    assert results[0]["similarity"] == pytest.approx(1.0)
+
+
+def test_quantize_preserves_direction() -> None:
+    """Test that INT8 quantization keeps the embedding direction."""
+    vector = np.random.default_rng(0).standard_normal(768).astype(np.float32)
+
+    quantized, scale = _quantize(vector)
+    restored = quantized.astype(np.float32) * scale
+
+    assert quantized.dtype == np.int8
+    assert np.abs(quantized).max() == 127
+    cosine = restored @ vector / (np.linalg.norm(restored) * np.linalg.norm(vector))
+    assert cosine > 0.99
+
+
+def test_search_numpy_fallback_matches_numba(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the blocked NumPy scoring path gives the same scores."""
+    from src.analysis import embeddings
+
+    engine = SemanticSearchEngine(StubEmbedder())
+    for i, title in enumerate(["vision", "speech", "audio", "speech", "vision"]):
+        engine.index_paper(f"p{i}", title, "Abstract")
+    query = StubEmbedder().embed_text("audio").embedding
+    expected = engine._cosine_scores(query).copy()
+
+    monkeypatch.setattr(embeddings, "NUMBA_AVAILABLE", False)
+    monkeypatch.setattr(embeddings, "FALLBACK_BLOCK_ROWS", 2)
+    actual = engine._cosine_scores(query)
+
+    np.testing.assert_allclose(actual, expected, rtol=1e-6)
@@ -0,0 +1,44 @@
+"""
+Tests for the Groq LLM analyzer client sharing.
+"""
+
+import pytest
+
+from src.analysis import llm_analyzer
+from src.analysis.llm_analyzer import GroqAnalyzer, analyze_with_groq
+
+
+@pytest.fixture(autouse=True)
+def empty_caches(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test without cached clients or analyzers."""
+    monkeypatch.setattr(llm_analyzer, "_groq_clients", {})
+    monkeypatch.setattr(llm_analyzer, "_groq_analyzers", {})
+
+
+def test_analyzers_with_same_key_share_client() -> None:
+    """Test that analyzers for one API key reuse one Groq client."""
+    first = GroqAnalyzer(api_key="key-a")
+    second = GroqAnalyzer(api_key="key-a")
+    other = GroqAnalyzer(api_key="key-b")
+
+    assert first.client is second.client
+    assert other.client is not first.client
+
+
+def test_shared_client_keeps_sdk_defaults() -> None:
+    """Test that the pooled HTTP client keeps the Groq SDK's redirect setting."""
+    http_client = llm_analyzer._create_http_client()
+
+    assert http_client.follow_redirects is True
+
+
+def test_analyze_with_groq_reuses_analyzer(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that analyze_with_groq builds one analyzer per API key."""
+    seen = []
+    monkeypatch.setattr(GroqAnalyzer, "analyze_paper", lambda self, paper: seen.append(self) or {})
+
+    analyze_with_groq(object(), api_key="key-a")
+    analyze_with_groq(object(), api_key="key-a")
+
+    assert len(seen) == 2
+    assert seen[0] is seen[1]
@@ -0,0 +1,204 @@
+"""
+Tests for the scientific NLP components.
+
+These run on a blank spaCy pipeline (tokenizer + sentencizer), so they do
+not need the en_core_web_sm model.
+"""
+
+import pytest
+import spacy
+from nltk.corpus import stopwords as nltk_stopwords
+from spacy.tokens import Doc
+
+from src.analysis import nlp_processor
+from src.analysis.academic_analyzer import AcademicAnalyzer
+from src.models.paper import Paper
+
+
+def test_analyzer_falls_back_when_spacy_model_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a spaCy load error at startup falls back to template analysis."""
+
+    def missing_model():
+        raise OSError("[E050] Can't find model 'en_core_web_sm'")
+
+    monkeypatch.setattr(nlp_processor, "_load_nlp", missing_model)
+
+    analyzer = AcademicAnalyzer(use_nlp=True, use_llm=False)
+    analysis = analyzer.analyze(Paper(title="A Paper", abstract="We study things."))
+
+    assert analyzer.nlp_processor is None
+    assert analysis.paper_title == "A Paper"
+
+
+def test_discourse_scoring_same_with_and_without_automaton() -> None:
+    """Test that the Aho-Corasick and fallback paths classify sentences alike."""
+    pytest.importorskip("ahocorasick")
+    with_automaton = nlp_processor.DiscourseSegmenter()
+    without_automaton = nlp_processor.DiscourseSegmenter()
+    without_automaton.automaton = None
+    sentences = [
+        "The limitations of prior frameworks and processing challenges are discussed.",
+        "We propose a novel approach that outperforms existing methods.",
+        "Results show that accuracy improves in most settings.",
+        "In conclusion, future work will explore larger datasets.",
+        "Nothing here matches.",
+    ]
+
+    for position, sentence in enumerate(sentences):
+        for section_type in (None, "methodology", "introduction"):
+            expected = with_automaton._classify_sentence(sentence, section_type, position, len(sentences))
+            actual = without_automaton._classify_sentence(sentence, section_type, position, len(sentences))
+            assert actual == expected
+
+
+def test_discourse_classification_counts_substring_indicators() -> None:
+    """Test that indicators also match inside longer words."""
+    segmenter = nlp_processor.DiscourseSegmenter()
+    segmenter.automaton = None
+
+    function, confidence = segmenter._classify_sentence(
+        "The limitations of prior frameworks and processing challenges are discussed.",
+        None, 2, 5,
+    )
+
+    # "framework" + "process": METHOD 2; "limitation" + "challenge":
+    # LIMITATION 2; "prior": BACKGROUND 1. Ties go to the first in enum order.
+    assert function == nlp_processor.RhetoricalFunction.METHOD
+    assert confidence == pytest.approx(2 / 3)
+
+
+@pytest.fixture
+def blank_nlp():
+    """Blank English pipeline with rule-based sentence boundaries."""
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    return nlp
+
+
+@pytest.fixture
+def stub_stopwords(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace the NLTK stopword list so tests need no NLTK data."""
+    monkeypatch.setattr(nlp_processor, "_load_stopwords", lambda: frozenset({"the", "a", "of"}))
+
+
+def _chunked_doc(nlp, phrases: list[str]) -> Doc:
+    """Build a parsed Doc where each two-word phrase is one noun chunk."""
+    words, heads, deps, pos = [], [], [], []
+    for phrase in phrases:
+        modifier, noun = phrase.split()
+        start = len(words)
+        words += [modifier, noun, "."]
+        heads += [start + 1, start + 1, start + 1]
+        deps += ["compound", "ROOT", "punct"]
+        pos += ["NOUN", "NOUN", "PUNCT"]
+    return Doc(nlp.vocab, words=words, heads=heads, deps=deps, pos=pos)
+
+
+def test_sentence_lookup_maps_offsets_to_sentences(blank_nlp) -> None:
+    """Test that character offsets resolve to the text of their sentence."""
+    ner = nlp_processor.ScientificNER(blank_nlp)
+    doc = blank_nlp("First sentence here. Second one follows.")
+
+    find_context = ner._sentence_lookup(doc)
+
+    assert find_context(0) == "First sentence here."
+    assert find_context(doc.text.index("Second")) == "Second one follows."
+    assert find_context(len(doc.text) - 1) == "Second one follows."
+
+
+def test_ner_merges_keywords_and_patterns_without_duplicates(blank_nlp) -> None:
+    """Test that keyword and regex entities are merged and deduplicated."""
+    ner = nlp_processor.ScientificNER(blank_nlp)
+
+    entities = ner.extract_entities(
+        "Accuracy reached 95.5%x on MNIST. The accuracy of detection improved."
+    )
+
+    found = [(e.entity_type, e.text) for e in entities]
+    metric = nlp_processor.ScientificEntityType.METRIC
+    assert found.count((metric, "Accuracy")) == 1
+    assert (metric, "accuracy") not in found
+    assert (metric, "95.5%") in found
+    assert (metric, "5%") not in found
+    assert (nlp_processor.ScientificEntityType.MATERIAL, "MNIST") in found
+    # A term listed under two types is reported once per type
+    assert (nlp_processor.ScientificEntityType.METHOD, "detection") in found
+    assert (nlp_processor.ScientificEntityType.TASK, "detection") in found
+    mnist = next(e for e in entities if e.text == "MNIST")
+    assert mnist.context == "Accuracy reached 95.5%x on MNIST."
+
+
+def test_keyphrases_keep_first_seen_order_on_ties(blank_nlp, stub_stopwords) -> None:
+    """Test that equally frequent phrases are ranked in first-seen order."""
+    extractor = nlp_processor.KeyPhraseExtractor(blank_nlp)
+    doc = _chunked_doc(blank_nlp, ["deep net", "graph model", "graph model", "deep net", "fast path"])
+
+    assert extractor.extract(doc) == [("deep net", 2.0), ("graph model", 2.0), ("fast path", 1.0)]
+    assert extractor.extract(doc, max_phrases=1) == [("deep net", 2.0)]
+
+
+def test_keyphrase_cache_returns_copies(blank_nlp, stub_stopwords) -> None:
+    """Test that cached results cannot be changed through a returned list."""
+    extractor = nlp_processor.KeyPhraseExtractor(blank_nlp)
+    doc = _chunked_doc(blank_nlp, ["deep net"])
+
+    first = extractor.extract(doc)
+    first.append(("injected", 9.0))
+
+    assert extractor.extract(doc) == [("deep net", 1.0)]
+
+
+def test_keyphrase_cache_evicts_oldest(
+    blank_nlp, stub_stopwords, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the key phrase cache drops its oldest entry when full."""
+    monkeypatch.setattr(nlp_processor, "KEYPHRASE_CACHE_SIZE", 2)
+    extractor = nlp_processor.KeyPhraseExtractor(blank_nlp)
+    docs = [_chunked_doc(blank_nlp, [phrase]) for phrase in ("deep net", "graph model", "fast path")]
+
+    for doc in docs:
+        extractor.extract(doc)
+
+    assert list(extractor._cache) == [(docs[1].text, 20), (docs[2].text, 20)]
+
+
+def test_ner_finds_versioned_dataset_names(blank_nlp) -> None:
+    """Test that names like ImageNet-1k (one spaCy token) still yield the keyword."""
+    ner = nlp_processor.ScientificNER(blank_nlp)
+
+    entities = ner.extract_entities(
+        "We train on ImageNet-1k, COCO-2017 and LibriSpeech-960h using PyTorch."
+    )
+
+    material = nlp_processor.ScientificEntityType.MATERIAL
+    found = {(e.entity_type, e.text) for e in entities}
+    assert {(material, "ImageNet"), (material, "COCO"), (material, "LibriSpeech")} <= found
+    assert (nlp_processor.ScientificEntityType.TOOL, "PyTorch") in found
+    # A keyword followed by more word characters is a different word
+    assert not any(e.text.lower() == "r" for e in ner.extract_entities("Results on Rome."))
+
+
+def test_process_batch_in_workers_matches_in_process(
+    blank_nlp, tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the worker pool gives the same results as in-process batching."""
+    try:
+        nltk_stopwords.words("english")
+    except LookupError:
+        pytest.skip("NLTK stopwords not installed (needed in worker processes)")
+
+    # Workers are spawned and load SPACY_MODEL themselves
+    blank_nlp.to_disk(tmp_path / "pipeline")
+    monkeypatch.setenv("PAPER_SPACY_MODEL", str(tmp_path / "pipeline"))
+    processor = nlp_processor.NLPProcessor()
+    processor._nlp = blank_nlp
+    texts = [f"Text {i} uses TensorFlow on MNIST. Accuracy improved." for i in range(6)]
+    sections = ["methodology", None, "results", None, "conclusion", None]
+
+    expected = processor.process_batch(texts, sections)
+    monkeypatch.setattr(nlp_processor, "PARALLEL_MIN_CHARS", 0)
+    monkeypatch.setattr(nlp_processor.os, "cpu_count", lambda: 2)
+    actual = processor.process_batch(texts, sections)
+
+    assert nlp_processor._pool is not None
+    assert repr(actual) == repr(expected)
@@ -2,43 +2,45 @@
 Tests for PDF parsers.
 """
 
+import tracemalloc
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.ingestion.base_parser import AbstractParser
-from src.ingestion.simple_parser import SimplePDFParser
+from src.ingestion.simple_parser import _SECTION_HEADER, SimplePDFParser
 from src.models.paper import Paper, SectionType
 
 
-def test_abstract_parser_validate_pdf_exists(tmp_path: Path) -> None:
-    """Test that validate_pdf raises error for non-existent file."""
-    
-    class DummyParser(AbstractParser):
-        def parse(self, pdf_path: Path) -> Paper:
-            return Paper(title="Dummy")
-    
-    parser = DummyParser()
-    non_existent = tmp_path / "nonexistent.pdf"
-    
-    with pytest.raises(FileNotFoundError):
-        parser.validate_pdf(non_existent)
+class _DummyParser(AbstractParser):
+    def parse(self, pdf_path: Path) -> Paper:
+        return Paper(title="Dummy")
 
 
-def test_abstract_parser_validate_pdf_extension(tmp_path: Path) -> None:
-    """Test that validate_pdf raises error for non-PDF file."""
-    
-    class DummyParser(AbstractParser):
-        def parse(self, pdf_path: Path) -> Paper:
-            return Paper(title="Dummy")
-    
-    parser = DummyParser()
+def _missing_pdf(tmp_path: Path) -> Path:
+    return tmp_path / "nonexistent.pdf"
+
+
+def _text_file(tmp_path: Path) -> Path:
     txt_file = tmp_path / "document.txt"
     txt_file.write_text("Not a PDF")
-    
-    with pytest.raises(ValueError, match="not a PDF"):
-        parser.validate_pdf(txt_file)
+    return txt_file
+
+
+@pytest.mark.parametrize(
+    ("make_path", "error", "message"),
+    [
+        (_missing_pdf, FileNotFoundError, "not found"),
+        (_text_file, ValueError, "not a PDF"),
+    ],
+    ids=["missing", "not-pdf"],
+)
+def test_abstract_parser_validate_pdf(tmp_path: Path, make_path, error: type, message: str) -> None:
+    """Test that validate_pdf rejects missing and non-PDF files."""
+    with pytest.raises(error, match=message):
+        _DummyParser().validate_pdf(make_path(tmp_path))
 
 
 def test_simple_parser_section_detection() -> None:
@@ -48,12 +50,15 @@ def test_simple_parser_section_detection() -> None:
     # Test abstract pattern
     assert parser.SECTION_PATTERNS[SectionType.ABSTRACT]
     
-    # Test that patterns are case-insensitive
-    import re
+    # Test that patterns are precompiled and case-insensitive
     abstract_pattern = parser.SECTION_PATTERNS[SectionType.ABSTRACT]
-    assert re.match(abstract_pattern, "Abstract")
-    assert re.match(abstract_pattern, "ABSTRACT")
-    assert re.match(abstract_pattern, "abstract")
+    assert abstract_pattern.match("Abstract")
+    assert abstract_pattern.match("ABSTRACT")
+    assert abstract_pattern.match("abstract")
+    
+    # All patterns are also fused into one regex; the named group gives the type
+    for header in ("Abstract", "ABSTRACT", "1. abstract"):
+        assert _SECTION_HEADER.match(header).lastgroup == SectionType.ABSTRACT.name
 
 
 @patch("src.ingestion.simple_parser.PdfReader")
@@ -63,19 +68,8 @@ def test_simple_parser_basic_parsing(mock_pdf_reader: MagicMock, tmp_path: Path)
     pdf_file = tmp_path / "test.pdf"
     pdf_file.write_bytes(b"%PDF-1.4\nDummy PDF content")
     
-    # Mock the PdfReader
-    mock_reader_instance = MagicMock()
-    mock_pdf_reader.return_value = mock_reader_instance
-    
-    # Mock metadata
-    mock_reader_instance.metadata = {
-        "/Title": "Test Paper Title",
-        "/Author": "John Doe, Jane Smith"
-    }
-    
-    # Mock pages
-    mock_page = MagicMock()
-    mock_page.extract_text.return_value = """
+    # Stub the PdfReader; the parser only reads these attributes
+    page_text = """
     Test Paper Title
     John Doe, Jane Smith
     
@@ -85,10 +79,16 @@ def test_simple_parser_basic_parsing(mock_pdf_reader: MagicMock, tmp_path: Path)
     Introduction
     This is the introduction section.
     """
-    mock_reader_instance.pages = [mock_page]
+    mock_pdf_reader.return_value = SimpleNamespace(
+        metadata={
+            "/Title": "Test Paper Title",
+            "/Author": "John Doe, Jane Smith"
+        },
+        pages=[SimpleNamespace(extract_text=lambda: page_text)],
+    )
     
     # Parse the PDF
-    parser = SimplePDFParser()
+    parser = SimplePDFParser(backend="pypdf")
     paper = parser.parse(pdf_file)
     
     # Assertions
@@ -100,17 +100,251 @@ def test_simple_parser_basic_parsing(mock_pdf_reader: MagicMock, tmp_path: Path)
     assert "simple" in paper.parser_version
 
 
-def test_simple_parser_extract_title_fallback(tmp_path: Path) -> None:
+@patch("src.ingestion.simple_parser.PdfReader")
+def test_simple_parser_extract_title_fallback(mock_pdf_reader: MagicMock, tmp_path: Path) -> None:
     """Test that SimplePDFParser falls back to first line if no metadata title."""
-    parser = SimplePDFParser()
-    
-    # Mock reader with no metadata
-    mock_reader = MagicMock()
-    mock_reader.metadata = None
+    pdf_file = tmp_path / "test.pdf"
+    pdf_file.write_bytes(b"%PDF-1.4\nDummy PDF content")
     
+    # Reader stub with no metadata; the page stays a mock to count extractions
     mock_page = MagicMock()
     mock_page.extract_text.return_value = "Fallback Title\nSome content"
-    mock_reader.pages = [mock_page]
+    mock_pdf_reader.return_value = SimpleNamespace(metadata=None, pages=[mock_page])
     
-    title = parser._extract_title(mock_reader.metadata, mock_reader)
-    assert title == "Fallback Title"
+    paper = SimplePDFParser(backend="pypdf").parse(pdf_file)
+    assert paper.title == "Fallback Title"
+    # The title fallback reuses the page text extracted for section detection
+    mock_page.extract_text.assert_called_once()
+
+
+def test_simple_parser_detect_sections() -> None:
+    """Test that _detect_sections splits text on recognized headers."""
+    parser = SimplePDFParser()
+    text = "\n".join([
+        "A Paper Title",
+        "Abstract",
+        "We study things.",
+        "",
+        "1. Introduction",
+        "Things matter.",
+        "II. METHODS",
+        "We measured things.",
+        "This line is far too long to be considered a section header by the parser heuristics",
+        "Summary",
+        "Things were studied.",
+    ])
+
+    sections = parser._detect_sections(text)
+
+    assert [s.section_type for s in sections] == [
+        SectionType.OTHER,
+        SectionType.ABSTRACT,
+        SectionType.INTRODUCTION,
+        SectionType.METHODOLOGY,
+        SectionType.ABSTRACT,
+    ]
+    assert sections[0].title is None
+    assert sections[0].content == "A Paper Title"
+    assert sections[2].title == "1. Introduction"
+    assert sections[3].content.endswith("section header by the parser heuristics")
+
+
+@patch("src.ingestion.simple_parser.PdfReader")
+def test_simple_parser_sections_span_pages(mock_pdf_reader: MagicMock, tmp_path: Path) -> None:
+    """Test that sections are detected across page boundaries while streaming."""
+    pdf_file = tmp_path / "test.pdf"
+    pdf_file.write_bytes(b"%PDF-1.4\nDummy PDF content")
+
+    mock_pdf_reader.return_value = SimpleNamespace(
+        metadata={"/Title": "Test Paper Title"},
+        pages=[
+            SimpleNamespace(extract_text=lambda: "Abstract\nWe study things."),
+            SimpleNamespace(extract_text=lambda: "More abstract.\nIntroduction\nThings matter."),
+        ],
+    )
+
+    paper = SimplePDFParser(backend="pypdf").parse(pdf_file)
+
+    assert [s.section_type for s in paper.sections] == [
+        SectionType.ABSTRACT,
+        SectionType.INTRODUCTION,
+    ]
+    assert paper.abstract == "We study things.\nMore abstract."
+
+
+def test_simple_parser_pymupdf_backend(tmp_path: Path) -> None:
+    """Test that the PyMuPDF backend reads metadata and page text."""
+    pymupdf = pytest.importorskip("pymupdf")
+
+    pdf_file = tmp_path / "test.pdf"
+    document = pymupdf.open()
+    page = document.new_page()
+    page.insert_text((72, 72), "Abstract\nWe study things.\nIntroduction\nThings matter.")
+    document.set_metadata({"title": "Test Paper Title", "author": "John Doe; Jane Smith"})
+    document.save(str(pdf_file))
+    document.close()
+
+    paper = SimplePDFParser(backend="pymupdf").parse(pdf_file)
+
+    assert paper.title == "Test Paper Title"
+    assert [a.name for a in paper.authors] == ["John Doe", "Jane Smith"]
+    assert [s.section_type for s in paper.sections] == [
+        SectionType.ABSTRACT,
+        SectionType.INTRODUCTION,
+    ]
+    assert paper.abstract == "We study things."
+
+
+def test_simple_parser_pdfium_backend(tmp_path: Path) -> None:
+    """Test that the pypdfium2 backend reads page text and falls back to it for the title."""
+    pymupdf = pytest.importorskip("pymupdf")
+    pytest.importorskip("pypdfium2")
+
+    pdf_file = tmp_path / "test.pdf"
+    document = pymupdf.open()
+    page = document.new_page()
+    page.insert_text((72, 72), "Test Paper Title\nAbstract\nWe study things.\nIntroduction\nThings matter.")
+    document.save(str(pdf_file))
+    document.close()
+
+    paper = SimplePDFParser(backend="pdfium").parse(pdf_file)
+
+    assert paper.title == "Test Paper Title"
+    assert [s.section_type for s in paper.sections] == [
+        SectionType.OTHER,
+        SectionType.ABSTRACT,
+        SectionType.INTRODUCTION,
+    ]
+    assert paper.abstract == "We study things."
+
+
+@patch("src.ingestion.simple_parser.PdfReader")
+def test_simple_parser_streams_pages(mock_pdf_reader: MagicMock, tmp_path: Path) -> None:
+    """Test that page texts are processed one at a time, never joined into one string."""
+    pdf_file = tmp_path / "test.pdf"
+    pdf_file.write_bytes(b"%PDF-1.4\nDummy PDF content")
+
+    # 500 pages of ~20 KB each; blank lines add no section content, so only
+    # the page being processed should be alive at any time (~10 MB in total)
+    page = SimpleNamespace(extract_text=lambda: (" " * 200 + "\n") * 100)
+    mock_pdf_reader.return_value = SimpleNamespace(metadata={"/Title": "Title"}, pages=[page] * 500)
+
+    tracemalloc.start()
+    try:
+        SimplePDFParser(backend="pypdf", cache=False).parse(pdf_file)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 2_000_000
+
+
+def test_simple_parser_pymupdf_loads_pages_on_demand(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the PyMuPDF backend loads each page only when its text is read."""
+    pymupdf = pytest.importorskip("pymupdf")
+    from src.ingestion.simple_parser import _PyMuPDFReader
+
+    pdf_file = tmp_path / "test.pdf"
+    document = pymupdf.open()
+    for i in range(5):
+        document.new_page().insert_text((72, 72), f"Page {i}")
+    document.save(str(pdf_file))
+    document.close()
+
+    loaded = []
+    load_page = pymupdf.Document.load_page
+    monkeypatch.setattr(
+        pymupdf.Document, "load_page", lambda self, i, *args: loaded.append(i) or load_page(self, i, *args)
+    )
+
+    reader = _PyMuPDFReader(str(pdf_file))
+    try:
+        assert len(reader.pages) == 5
+        assert loaded == []
+        assert reader.pages[3].extract_text().strip() == "Page 3"
+        assert loaded == [3]
+    finally:
+        reader.close()
+
+
+def test_simple_parser_unknown_backend() -> None:
+    """Test that an unknown backend name is rejected."""
+    with pytest.raises(ValueError, match="Unknown PDF backend"):
+        SimplePDFParser(backend="nope")
+
+
+def test_simple_parser_parallel_pages_keep_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that pages extracted in worker processes come back in page order."""
+    pymupdf = pytest.importorskip("pymupdf")
+    from src.ingestion import simple_parser
+    from src.ingestion.simple_parser import PARALLEL_MIN_PAGES
+
+    # Use two workers even on single-core machines
+    monkeypatch.setattr(simple_parser.os, "cpu_count", lambda: 2)
+
+    pdf_file = tmp_path / "long.pdf"
+    document = pymupdf.open()
+    for i in range(PARALLEL_MIN_PAGES + 3):
+        document.new_page().insert_text((72, 72), f"Results\nPage {i} text.")
+    document.save(str(pdf_file))
+    document.close()
+
+    parallel = SimplePDFParser(parallel=True).parse(pdf_file)
+    sequential = SimplePDFParser(parallel=False).parse(pdf_file)
+
+    assert [s.content for s in parallel.sections] == [s.content for s in sequential.sections]
+    assert parallel.sections[-1].content == f"Page {PARALLEL_MIN_PAGES + 2} text."
+
+
+@patch("src.ingestion.simple_parser.PdfReader")
+def test_simple_parser_caches_by_content(mock_pdf_reader: MagicMock, tmp_path: Path) -> None:
+    """Test that a PDF with unchanged bytes is served from the parse cache."""
+    pdf_file = tmp_path / "test.pdf"
+    pdf_file.write_bytes(b"%PDF-1.4\nDummy PDF content")
+    copy_file = tmp_path / "copy.pdf"
+    copy_file.write_bytes(pdf_file.read_bytes())
+
+    mock_pdf_reader.return_value = SimpleNamespace(
+        metadata={"/Title": "Test Paper Title"},
+        pages=[SimpleNamespace(extract_text=lambda: "Abstract\nWe study things.")],
+    )
+
+    parser = SimplePDFParser(backend="pypdf", cache=True)
+    first = parser.parse(pdf_file)
+    second = parser.parse(copy_file)
+
+    assert mock_pdf_reader.call_count == 1
+    assert second.sections == first.sections
+    assert second.source_file == str(copy_file)
+    assert second.ingestion_timestamp > first.ingestion_timestamp
+
+    # The cache is opt-in
+    SimplePDFParser(backend="pypdf").parse(pdf_file)
+    assert mock_pdf_reader.call_count == 2
+
+
+@patch("src.ingestion.simple_parser.PdfReader")
+def test_simple_parser_cache_is_bounded(
+    mock_pdf_reader: MagicMock, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the parse cache keeps only the most recently used entries."""
+    from src.ingestion import simple_parser
+
+    monkeypatch.setattr(simple_parser, "PARSE_CACHE_MAX_ENTRIES", 2)
+    mock_pdf_reader.return_value = SimpleNamespace(
+        metadata={"/Title": "Test Paper Title"},
+        pages=[SimpleNamespace(extract_text=lambda: "Abstract\nWe study things.")],
+    )
+    parser = SimplePDFParser(backend="pypdf", cache=True)
+
+    for i in range(4):
+        pdf_file = tmp_path / f"test{i}.pdf"
+        pdf_file.write_bytes(f"%PDF-1.4\nDummy PDF content {i}".encode())
+        parser.parse(pdf_file)
+
+    assert len(list(parser.cache_dir.glob("*.json"))) == 2
+    assert not list(parser.cache_dir.glob("*.tmp"))
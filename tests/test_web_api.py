@@ -3,7 +3,9 @@ Test script to verify NLP is working in the web API.
 This script sends a test PDF to the /api/analyze endpoint.
 """
 
+import contextlib
 import sys
+from itertools import islice
 from pathlib import Path
 import requests
 from rich.console import Console
@@ -11,8 +13,28 @@ from rich.panel import Panel
 from rich.json import JSON
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+    STREAMING_UPLOAD_AVAILABLE = True
+except ImportError:
+    STREAMING_UPLOAD_AVAILABLE = False
+
 console = Console()
 
+# Analysis fields shown by test_web_api_nlp, with the default for a missing field
+_ANALYSIS_FIELDS = (
+    ('methodology', {}),
+    ('key_concepts', {}),
+    ('main_contributions', ()),
+    ('limitations', ()),
+    ('thematic_tags', ()),
+)
+
 
 def test_web_api_nlp(pdf_path: str = None, server_url: str = "http://localhost:8000"):
     """
@@ -22,13 +44,20 @@ def test_web_api_nlp(pdf_path: str = None, server_url: str = "http://localhost:8
         pdf_path: Path to PDF file to test (optional)
         server_url: URL of the server
     """
+    # One session for the run, so the upload reuses the health check's connection
+    with requests.Session() as session:
+        return _check_web_api(session, pdf_path, server_url)
+
+
+def _check_web_api(session: requests.Session, pdf_path: str, server_url: str) -> bool:
+    """Run the health check and, given a PDF, the analyze round trip."""
     console.print("\n[bold cyan]🌐 Testing Web API NLP Integration[/bold cyan]\n")
     
     # Check if server is running
     console.print(f"[dim]Server URL:[/dim] {server_url}")
     
     try:
-        response = requests.get(f"{server_url}/api/health", timeout=5)
+        response = session.head(f"{server_url}/api/health", timeout=5)
         if response.status_code == 200:
             console.print("[green]✓[/green] Server is running\n")
         else:
@@ -56,15 +85,31 @@ def test_web_api_nlp(pdf_path: str = None, server_url: str = "http://localhost:8
     console.print(f"[dim]Testing with:[/dim] {pdf_file.name}\n")
     
     # Send PDF to analyze endpoint
-    with console.status("[bold green]Uploading and analyzing PDF..."):
+    # The spinner repaints from a background thread; skip it when nobody sees it
+    status = (
+        console.status("[bold green]Uploading and analyzing PDF...")
+        if console.is_terminal
+        else contextlib.nullcontext()
+    )
+    with status:
         try:
             with open(pdf_file, 'rb') as f:
-                files = {'file': (pdf_file.name, f, 'application/pdf')}
-                response = requests.post(
-                    f"{server_url}/api/analyze",
-                    files=files,
-                    timeout=60
-                )
+                if STREAMING_UPLOAD_AVAILABLE:
+                    # Stream the multipart body from disk instead of building it in memory
+                    encoder = MultipartEncoder(fields={'file': (pdf_file.name, f, 'application/pdf')})
+                    response = session.post(
+                        f"{server_url}/api/analyze",
+                        data=encoder,
+                        headers={'Content-Type': encoder.content_type},
+                        timeout=60
+                    )
+                else:
+                    files = {'file': (pdf_file.name, f, 'application/pdf')}
+                    response = session.post(
+                        f"{server_url}/api/analyze",
+                        files=files,
+                        timeout=60
+                    )
         except requests.exceptions.RequestException as e:
             console.print(f"[red]✗[/red] Request failed: {e}\n")
             return False
@@ -79,8 +124,9 @@ def test_web_api_nlp(pdf_path: str = None, server_url: str = "http://localhost:8
     
     # Parse response
     try:
-        data = response.json()
-    except json.JSONDecodeError as e:
+        # orjson parses the raw bytes, skipping the decode to str
+        data = orjson.loads(response.content) if orjson is not None else response.json()
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
         console.print(f"[red]✗[/red] Invalid JSON response: {e}\n")
         return False
     
@@ -90,13 +136,33 @@ def test_web_api_nlp(pdf_path: str = None, server_url: str = "http://localhost:8
         console.print(data)
         return False
     
+    # Buffer the whole report and write it in one go instead of once per line
+    with console:
+        _print_analysis(data.get('analysis', {}))
+    
+    # Option to save full response
+    console.print("[dim]Full response saved to: test_api_response.json[/dim]")
+    if orjson is not None:
+        with open('test_api_response.json', 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open('test_api_response.json', 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    
+    return True
+
+
+def _print_analysis(analysis: dict) -> None:
+    """Print the analysis report and whether NLP features were detected."""
     console.print(Panel.fit(
         "[bold green]Analysis Successful![/bold green]",
         border_style="green"
     ))
     
     # Show analysis details
-    analysis = data.get('analysis', {})
+    methodology, key_concepts, contributions, limitations, tags = (
+        analysis.get(field, default) for field, default in _ANALYSIS_FIELDS
+    )
     
     console.print("\n[bold yellow]📊 Analysis Results[/bold yellow]\n")
     
@@ -108,7 +174,6 @@ def test_web_api_nlp(pdf_path: str = None, server_url: str = "http://localhost:8
     console.print("[bold yellow]🔍 NLP Features Detected[/bold yellow]\n")
     
     # Methodology
-    methodology = analysis.get('methodology', {})
     if methodology:
         console.print("[cyan]Methodology:[/cyan]")
         console.print(f"  Input Data: {methodology.get('input_data', 'N/A')}")
@@ -116,10 +181,9 @@ def test_web_api_nlp(pdf_path: str = None, server_url: str = "http://localhost:8
         console.print(f"  Evaluation: {methodology.get('evaluation', 'N/A')}\n")
     
     # Key concepts
-    key_concepts = analysis.get('key_concepts', {})
     if key_concepts:
         console.print(f"[cyan]Key Concepts:[/cyan] {len(key_concepts)} found")
-        for i, (concept, definition) in enumerate(list(key_concepts.items())[:5], 1):
+        for i, (concept, definition) in enumerate(islice(key_concepts.items(), 5), 1):
             console.print(f"  {i}. {concept}")
         if len(key_concepts) > 5:
             console.print(f"  ... and {len(key_concepts) - 5} more\n")
@@ -127,7 +191,6 @@ def test_web_api_nlp(pdf_path: str = None, server_url: str = "http://localhost:8
             console.print()
     
     # Contributions
-    contributions = analysis.get('main_contributions', [])
     if contributions:
         console.print(f"[cyan]Main Contributions:[/cyan] {len(contributions)} found")
         for i, contrib in enumerate(contributions, 1):
@@ -135,7 +198,6 @@ def test_web_api_nlp(pdf_path: str = None, server_url: str = "http://localhost:8
         console.print()
     
     # Limitations
-    limitations = analysis.get('limitations', [])
     if limitations:
         console.print(f"[cyan]Limitations:[/cyan] {len(limitations)} found")
         for i, limit in enumerate(limitations, 1):
@@ -143,7 +205,6 @@ def test_web_api_nlp(pdf_path: str = None, server_url: str = "http://localhost:8
         console.print()
     
     # Thematic tags
-    tags = analysis.get('thematic_tags', [])
     if tags:
         console.print(f"[cyan]Thematic Tags:[/cyan] {', '.join(tags)}\n")
     
@@ -153,8 +214,9 @@ def test_web_api_nlp(pdf_path: str = None, server_url: str = "http://localhost:8
     nlp_indicators = []
     
     # Check if techniques were extracted (NLP feature)
-    if methodology.get('techniques') and len(methodology['techniques']) > 0:
-        if not any('requires' in t.lower() for t in methodology['techniques']):
+    techniques = methodology.get('techniques')
+    if techniques:
+        if not any('requires' in t.lower() for t in techniques):
             nlp_indicators.append("✓ Techniques extracted via NER")
     
     # Check if key concepts were extracted (NLP feature)
@@ -163,7 +225,7 @@ def test_web_api_nlp(pdf_path: str = None, server_url: str = "http://localhost:8
             nlp_indicators.append("✓ Key concepts extracted via NLP")
     
     # Check if contributions were extracted (NLP feature)
-    if contributions and len(contributions) > 0:
+    if contributions:
         if not any('requires' in c.lower() for c in contributions):
             nlp_indicators.append("✓ Contributions extracted via discourse analysis")
     
@@ -177,13 +239,6 @@ def test_web_api_nlp(pdf_path: str = None, server_url: str = "http://localhost:8
         console.print("  1. NLP dependencies not installed")
         console.print("  2. Server needs to be restarted")
         console.print("  3. PDF content is minimal\n")
-    
-    # Option to save full response
-    console.print("[dim]Full response saved to: test_api_response.json[/dim]")
-    with open('test_api_response.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    
-    return True
 
 
 def main():
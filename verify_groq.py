@@ -12,7 +12,7 @@ print("🔍 Verificación de Groq\n")
 print("="*50)
 
 if api_key:
-    masked = api_key[:7] + "..." + api_key[-4:]
+    masked = f"{api_key[:7]}...{api_key[-4:]}"
     print(f"✓ GROQ_API_KEY encontrada: {masked}")
     print(f"✓ Longitud: {len(api_key)} caracteres")
     